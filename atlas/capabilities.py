@@ -1,32 +1,76 @@
 """
 Store adapter capability protocols: Optional interfaces for atlas adapters.
 
-These protocols allow adapters to expose optional capabilities that
-routers/API code can depend on via isinstance() checks, replacing
-scattered hasattr() and type checks.
+These protocols describe the signatures of optional capabilities that
+adapters can expose. At runtime, adapters advertise them through a frozen
+StoreCapabilities record built once at construction (``store.caps``),
+holding the bound capability methods or None. Dispatch is a single
+attribute read instead of a Protocol isinstance() walk.
 
 Pattern:
-    if isinstance(store, SupportsSqlPushdown):
-        return store.compute_aggregate_sql(request)
+    if (compute := capabilities_of(store).compute_aggregate_sql) is not None:
+        return compute(request)
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Callable, Protocol
 
 if TYPE_CHECKING:
     from atlas.models import AggregateRequest, AggregateResponse, SearchGroup
 
 
-@runtime_checkable
+@dataclass(frozen=True, slots=True)
+class StoreCapabilities:
+    """Bound capability methods of a store adapter (None when unsupported)."""
+
+    compute_aggregate_sql: Callable[[AggregateRequest], AggregateResponse] | None = None
+    refresh: Callable[[], None] | None = None
+    search: Callable[..., list[SearchGroup]] | None = None
+
+
+_CAPABILITY_NAMES = tuple(f.name for f in fields(StoreCapabilities))
+
+# Capability names available per adapter class, for adapters that don't
+# set ``caps``. A class's structure never changes at runtime.
+_type_caps_cache: dict[type, tuple[str, ...]] = {}
+
+
+def capabilities_of(store: Any) -> StoreCapabilities:
+    """
+    Get the capabilities a store adapter exposes.
+
+    Adapters normally build ``caps`` once at construction. Adapters that
+    don't are checked structurally (once per concrete class) and get a
+    record bound to their methods.
+
+    Args:
+        store: The store adapter instance.
+
+    Returns:
+        StoreCapabilities with a bound method for each supported capability.
+    """
+    caps = getattr(store, "caps", None)
+    if isinstance(caps, StoreCapabilities):
+        return caps
+
+    cls = type(store)
+    names = _type_caps_cache.get(cls)
+    if names is None:
+        names = tuple(
+            name for name in _CAPABILITY_NAMES if callable(getattr(cls, name, None))
+        )
+        _type_caps_cache[cls] = names
+    return StoreCapabilities(**{name: getattr(store, name) for name in names})
+
+
 class SupportsSqlPushdown(Protocol):
     """
     Adapter capability: SQL-based aggregate computation.
 
     Used by:
     - aggregate router: to push aggregation to SQL for large datasets
-
-    PostgresStoreAdapter implements this for efficient queries on 300k+ runs.
     """
 
     def compute_aggregate_sql(
@@ -45,7 +89,6 @@ class SupportsSqlPushdown(Protocol):
         ...
 
 
-@runtime_checkable
 class SupportsRefresh(Protocol):
     """
     Adapter capability: can refresh/re-scan state.
@@ -63,7 +106,6 @@ class SupportsRefresh(Protocol):
         ...
 
 
-@runtime_checkable
 class SupportsSearch(Protocol):
     """
     Adapter capability: native search with SQL pushdown.
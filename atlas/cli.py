@@ -13,6 +13,23 @@ from pathlib import Path
 
 import click
 
+# Bundled frontend can only change with a reinstall; check once at import
+_HAS_FRONTEND = (Path(__file__).parent / "static" / "index.html").exists()
+
+
+def _parse_pg_url(url: str) -> tuple[str, int, str]:
+    """Split a postgresql:// URL into (host, port, dbname) for display."""
+    _, _, rest = url.partition("://")
+    rest = rest.partition("?")[0]
+    netloc, _, path = rest.partition("/")
+    hostport = netloc.rpartition("@")[2]
+    if hostport.startswith("["):  # IPv6 literal: [::1]:5432
+        host, _, port = hostport[1:].partition("]")
+        port = port.lstrip(":")
+    else:
+        host, _, port = hostport.partition(":")
+    return host or "localhost", int(port) if port.isdigit() else 5432, path or "metalab"
+
 
 @click.group()
 def main():
@@ -77,9 +94,8 @@ def serve(
         # Auto-discover from service bundle
         metalab-atlas serve --discover /path/to/file_root
     """
-    import uvicorn
-
-    from atlas.deps import is_postgres_url
+    # Heavy imports (uvicorn, atlas.deps) are deferred to the branches that
+    # need them so --help and the error exits stay fast.
 
     # Handle --discover mode
     if discover:
@@ -118,6 +134,8 @@ def serve(
         )
         raise SystemExit(1)
 
+    from atlas.deps import is_postgres_url
+
     # Validate: must be a Postgres URL
     if not is_postgres_url(store):
         click.echo(
@@ -131,12 +149,6 @@ def serve(
         )
         raise SystemExit(1)
 
-    # Check if bundled frontend exists
-    static_dir = Path(__file__).parent / "static"
-    has_frontend = (static_dir / "index.html").exists()
-
-    click.echo("Starting MetaLab Atlas...")
-
     # Set environment variables for the app
     os.environ["ATLAS_STORE_PATH"] = store
 
@@ -144,32 +156,46 @@ def serve(
         os.environ["ATLAS_FILE_ROOT"] = str(Path(file_root).resolve())
 
     # Parse connection string for display
-    from urllib.parse import urlparse
+    pg_host, pg_port, db_name = _parse_pg_url(store)
+    host_port = f"{pg_host}:{pg_port}"
 
-    parsed = urlparse(store)
-    db_name = parsed.path.lstrip("/") if parsed.path else "metalab"
-    host_port = f"{parsed.hostname or 'localhost'}:{parsed.port or 5432}"
-
-    click.echo(f"  PostgreSQL: {host_port}/{db_name}")
+    lines = [
+        "Starting MetaLab Atlas...",
+        f"  PostgreSQL: {host_port}/{db_name}",
+    ]
     if file_root:
-        click.echo(f"  File root: {file_root}")
+        lines.append(f"  File root: {file_root}")
     else:
-        click.echo(f"  File root: (not set - artifact/log content unavailable)")
+        lines.append("  File root: (not set - artifact/log content unavailable)")
 
-    if has_frontend:
-        click.echo(f"  Dashboard: http://{host}:{port}")
+    if _HAS_FRONTEND:
+        lines.append(f"  Dashboard: http://{host}:{port}")
     else:
-        click.echo(f"  API only: http://{host}:{port}")
-        click.echo(f"  (No bundled frontend - run frontend dev server separately)")
-    click.echo(f"  API docs: http://{host}:{port}/docs")
-    click.echo()
-
-    uvicorn.run(
-        "atlas.main:app",
-        host=host,
-        port=port,
-        reload=reload,
-    )
+        lines.append(f"  API only: http://{host}:{port}")
+        lines.append("  (No bundled frontend - run frontend dev server separately)")
+    lines.append(f"  API docs: http://{host}:{port}/docs")
+    lines.append("")
+    click.echo("\n".join(lines))
+
+    import uvicorn
+
+    if reload:
+        # The reloader re-imports the app in a worker process, so the store
+        # is built there by the app lifespan.
+        uvicorn.run("atlas.main:app", host=host, port=port, reload=True)
+        return
+
+    # Build the store up front so the first request doesn't pay for it
+    from atlas.deps import init_store
+    from atlas.main import app
+
+    try:
+        app.state.store = init_store()
+    except Exception as e:
+        click.echo(f"Error: could not connect to store: {e}", err=True)
+        raise SystemExit(1)
+
+    uvicorn.run(app, host=host, port=port)
 
 
 if __name__ == "__main__":
@@ -7,45 +7,68 @@ Optionally, file_root can be provided for serving artifact/log content.
 
 from __future__ import annotations
 
+import functools
 import os
-from functools import lru_cache
+import threading
+from typing import TypeAlias
+
+from fastapi import Request
 
 from atlas.pg_store import PostgresStoreAdapter
 
 # Type alias for store adapter (Postgres-only)
-StoreAdapter = PostgresStoreAdapter
+StoreAdapter: TypeAlias = PostgresStoreAdapter
 
 
+@functools.cache
 def get_store_path() -> str:
-    """Get store path/URL from environment."""
+    """Get store path/URL from environment (read once; set by the CLI)."""
     return os.environ.get("ATLAS_STORE_PATH", "")
 
 
+@functools.cache
 def get_file_root() -> str | None:
-    """Get optional file root from environment."""
+    """Get optional file root from environment (read once; set by the CLI)."""
     return os.environ.get("ATLAS_FILE_ROOT")
 
 
 def is_postgres_url(path: str) -> bool:
     """Check if a path is a PostgreSQL connection string."""
-    return path.startswith("postgresql://") or path.startswith("postgres://")
+    return path.startswith(("postgresql://", "postgres://"))
+
 
+# Process-wide adapter singleton (one store per process lifetime)
+_store_singleton: PostgresStoreAdapter | None = None
+_store_lock = threading.Lock()
 
-@lru_cache(maxsize=1)
-def _get_postgres_store_singleton(
-    url: str,
-    file_root: str | None,
-) -> PostgresStoreAdapter:
-    """Create cached Postgres store adapter instance."""
-    return PostgresStoreAdapter(
-        connection_string=url,
-        file_root=file_root,
-    )
 
+def _get_postgres_store_singleton() -> PostgresStoreAdapter:
+    """Return the shared Postgres store adapter, creating it on first use.
 
-def get_store() -> StoreAdapter:
+    Configuration comes from the (cached) environment getters; call
+    reset_store_cache() to rebuild after changing it.
     """
-    Dependency that provides the store adapter.
+    global _store_singleton
+
+    store = _store_singleton
+    if store is not None:
+        return store
+
+    with _store_lock:
+        if _store_singleton is None:
+            _store_singleton = PostgresStoreAdapter(
+                connection_string=get_store_path(),
+                file_root=get_file_root(),
+            )
+        return _store_singleton
+
+
+def init_store() -> StoreAdapter:
+    """
+    Validate configuration and build the store adapter.
+
+    Called once from the FastAPI lifespan at startup, so the per-request
+    dependency doesn't re-validate the store URL.
 
     The store path is read from ATLAS_STORE_PATH environment variable
     and must be a PostgreSQL connection string.
@@ -72,26 +95,47 @@ def get_store() -> StoreAdapter:
             "Example: ATLAS_STORE_PATH=postgresql://user@localhost:5432/metalab"
         )
 
-    file_root = get_file_root()
-    return _get_postgres_store_singleton(store_path, file_root)
+    return _get_postgres_store_singleton()
+
+
+def get_store(request: Request) -> StoreAdapter:
+    """
+    Dependency that provides the store adapter.
+
+    Returns the adapter stored on ``app.state.store``, which the CLI (or
+    the app lifespan) builds once at startup. If the app was started
+    without either (e.g. a bare TestClient), the store is initialized on
+    first use instead.
+
+    Raises:
+        ValueError: If the store has to be initialized and
+            ATLAS_STORE_PATH is missing or not a PostgreSQL URL.
+    """
+    store = getattr(request.app.state, "store", None)
+    if store is None:
+        store = init_store()
+    return store
 
 
 def reset_store_cache() -> None:
     """Reset the store cache (for testing)."""
-    _get_postgres_store_singleton.cache_clear()
+    global _store_singleton
 
+    get_store_path.cache_clear()
+    get_file_root.cache_clear()
+    with _store_lock:
+        _store_singleton = None
 
-def refresh_stores() -> int:
+
+def refresh_stores(store: StoreAdapter) -> int:
     """
     Refresh store discovery to pick up new experiments.
 
     Returns 1 (single Postgres store).
     """
-    from atlas.capabilities import SupportsRefresh
-
-    store = get_store()
+    from atlas.capabilities import capabilities_of
 
-    if isinstance(store, SupportsRefresh):
-        store.refresh()
+    if (refresh := capabilities_of(store).refresh) is not None:
+        refresh()
 
     return 1
@@ -8,47 +8,78 @@ with optional metadata embedding for provenance tracking.
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+import orjson
+
+from atlas.models import RunResponse
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
-from atlas.models import RunResponse
-from atlas.store import StoreAdapter
+    from atlas.deps import StoreAdapter
+
+
+_CAPTURED_DATA_JSON_OPTS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+)
+
+
+def _captured_data_to_json(payload: dict[str, Any]) -> str:
+    """Serialize a run's structured results to a sorted-key JSON string."""
+    try:
+        return orjson.dumps(
+            payload, option=_CAPTURED_DATA_JSON_OPTS, default=str
+        ).decode("utf-8")
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits, which only stdlib json can encode
+        return json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+
+
+# Concurrent result fetches during export. Kept below the store's
+# connection pool size so exports don't starve interactive requests.
+_CAPTURED_DATA_WORKERS = 4
+
+
+def _collect_one(store: StoreAdapter, run_id: str) -> str | None:
+    """Fetch and serialize one run's structured results (None if none)."""
+    names = store.list_results(run_id)
+    if not names:
+        return None
+
+    payload: dict[str, Any] = {}
+    for name in sorted(names):
+        result = store.get_result(run_id, name)
+        if result is None:
+            continue
+        payload[name] = result
+
+    return _captured_data_to_json(payload) if payload else None
 
 
 def collect_captured_data_json(
     store: StoreAdapter,
     run_ids: list[str],
-) -> dict[str, str | None]:
+) -> list[str | None]:
     """
     Collect capture.data() structured results for a set of runs.
 
-    Returns a mapping of run_id -> JSON string (or None if no structured results).
-    """
-    out: dict[str, str | None] = {}
-    for run_id in run_ids:
-        names = store.list_results(run_id)
-        if not names:
-            out[run_id] = None
-            continue
+    Runs are fetched concurrently on a small thread pool (the lookups are
+    I/O bound).
 
-        payload: dict[str, Any] = {}
-        for name in sorted(names):
-            result = store.get_result(run_id, name)
-            if result is None:
-                continue
-            payload[name] = result
-
-        out[run_id] = (
-            json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
-            if payload
-            else None
-        )
+    Returns a list aligned with run_ids of JSON strings (None for runs
+    without structured results).
+    """
+    if len(run_ids) <= 1:
+        return [_collect_one(store, run_id) for run_id in run_ids]
 
-    return out
+    workers = min(_CAPTURED_DATA_WORKERS, len(run_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda run_id: _collect_one(store, run_id), run_ids))
 
 
 def runs_to_dataframe(
@@ -58,7 +89,7 @@ def runs_to_dataframe(
     include_derived: bool = True,
     include_record: bool = True,
     include_data: bool = True,
-    captured_data_json: dict[str, str | None] | None = None,
+    captured_data_json: list[str | None] | None = None,
 ) -> "pd.DataFrame":
     """
     Flatten runs to a pandas DataFrame.
@@ -76,7 +107,7 @@ def runs_to_dataframe(
         include_derived: Include derived metrics columns (prefixed with 'derived_').
         include_record: Include record fields (run_id, status, timestamps, etc.).
         include_data: Include capture.data() structured results as JSON string column.
-        captured_data_json: Optional mapping of run_id -> JSON string (or None).
+        captured_data_json: Optional JSON strings (or None) aligned with runs.
 
     Returns:
         pandas DataFrame with flattened run data.
@@ -91,68 +122,474 @@ def runs_to_dataframe(
             "pandas is required for export. Install with: pip install pandas"
         ) from e
 
-    rows = []
+    extractors = _field_extractors(
+        include_params=include_params,
+        include_metrics=include_metrics,
+        include_derived=include_derived,
+        include_record=include_record,
+    )
+    columns = _runs_to_columns(
+        runs, extractors, _captured_data_column(runs, include_data, captured_data_json)
+    )
+    return pd.DataFrame(columns, copy=False)
+
+
+FieldExtractor = Callable[[RunResponse], Iterable[tuple[str, Any]]]
+
+
+_RECORD_COLUMNS = (
+    "run_id",
+    "experiment_id",
+    "status",
+    "duration_ms",
+    "started_at",
+    "finished_at",
+)
+
+
+def _record_fields(run: RunResponse) -> tuple[tuple[str, Any], ...]:
+    """Record columns for one run."""
+    record = run.record
+    return (
+        ("run_id", record.run_id),
+        ("experiment_id", record.experiment_id),
+        ("status", record.status.value),
+        ("duration_ms", record.duration_ms),
+        ("started_at", record.started_at_iso),
+        ("finished_at", record.finished_at_iso),
+    )
+
+
+def _metric_fields(run: RunResponse) -> Iterable[tuple[str, Any]]:
+    """Metric columns (unprefixed) for one run."""
+    return run.metrics.items()
+
+
+def _prefixed_fields(namespace: str, prefix: str) -> FieldExtractor:
+    """Extractor for a dict namespace whose column names get a prefix.
+
+    Prefixed names are built once per key rather than once per run.
+    """
+    names: dict[str, str] = {}
+
+    def extract(run: RunResponse) -> Iterator[tuple[str, Any]]:
+        for key, value in getattr(run, namespace).items():
+            name = names.get(key)
+            if name is None:
+                name = names[key] = prefix + key
+            yield name, value
+
+    return extract
+
+
+def _field_extractors(
+    include_params: bool,
+    include_metrics: bool,
+    include_derived: bool,
+    include_record: bool,
+) -> list[FieldExtractor]:
+    """
+    Resolve the include_* flags once into the per-run extractors to apply.
+
+    Extractors are listed in export column order, so the per-run loop has
+    no flag checks. Captured data is not extracted per run; it arrives as
+    a ready-made column (see _captured_data_column).
+    """
+    extractors: list[FieldExtractor] = []
+    if include_record:
+        extractors.append(_record_fields)
+    if include_params:
+        extractors.append(_prefixed_fields("params", "param_"))
+    if include_metrics:
+        extractors.append(_metric_fields)
+    if include_derived:
+        extractors.append(_prefixed_fields("derived_metrics", "derived_"))
+    return extractors
+
+
+def _captured_data_column(
+    runs: list[RunResponse],
+    include_data: bool,
+    captured_data_json: list[str | None] | None,
+) -> list[str | None] | None:
+    """The captured_data column values aligned with runs (None to omit it)."""
+    if not include_data:
+        return None
+    if captured_data_json is None:
+        return [None] * len(runs)
+    return captured_data_json
+
+
+def _leading_columns(
+    extractors: list[FieldExtractor],
+    with_captured_data: bool,
+) -> list[str]:
+    """Columns placed before the per-run namespaces: record, then captured_data."""
+    if not with_captured_data:
+        return []
+    names = list(_RECORD_COLUMNS) if _record_fields in extractors else []
+    names.append("captured_data")
+    return names
+
+
+def _runs_to_columns(
+    runs: list[RunResponse],
+    extractors: list[FieldExtractor],
+    captured_data: list[str | None] | None = None,
+) -> dict[str, list[Any]]:
+    """
+    Flatten runs into column buffers (one list per column) in a single pass.
+
+    Columns appear in first-seen order and missing values are None, matching
+    what pandas builds from a list of row dicts. ``captured_data`` (aligned
+    with runs) is used as its column as-is, right after the record columns.
+    """
+    n = len(runs)
+    columns: dict[str, list[Any]] = {
+        name: [None] * n
+        for name in _leading_columns(extractors, captured_data is not None)
+    }
+    if captured_data is not None:
+        columns["captured_data"] = captured_data
+
+    for i, run in enumerate(runs):
+        for extract in extractors:
+            for key, value in extract(run):
+                col = columns.get(key)
+                if col is None:
+                    col = columns[key] = [None] * n
+                col[i] = value
+
+    return columns
+
+
+def _import_pyarrow():
+    """Import pyarrow, raising an ImportError with an install hint."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for export. "
+            "Install with: pip install pyarrow"
+        ) from e
+    return pa
+
+
+def _scan_arrow_schema(
+    runs: list[RunResponse],
+    extractors: list[FieldExtractor],
+    with_captured_data: bool = False,
+) -> "pa.Schema":
+    """
+    Determine the export schema from the Python value types of all runs.
+
+    Scanning up front gives every chunk of a streamed export the same
+    schema. Columns holding only bools, ints, floats (ints allowed) or
+    strings get the matching Arrow type; anything else (mixed types,
+    lists, dicts) is exported as text. captured_data is large_string:
+    its JSON payloads can exceed the 2 GB limit of 32-bit string offsets.
+    """
+    pa = _import_pyarrow()
+
+    seen: dict[str, set[type]] = {
+        name: set() for name in _leading_columns(extractors, with_captured_data)
+    }
     for run in runs:
-        row: dict[str, Any] = {}
-
-        if include_record:
-            row["run_id"] = run.record.run_id
-            row["experiment_id"] = run.record.experiment_id
-            row["status"] = run.record.status.value
-            row["duration_ms"] = run.record.duration_ms
-            row["started_at"] = run.record.started_at.isoformat()
-            row["finished_at"] = (
-                run.record.finished_at.isoformat() if run.record.finished_at else None
+        for extract in extractors:
+            for key, value in extract(run):
+                types = seen.get(key)
+                if types is None:
+                    types = seen[key] = set()
+                if value is not None:
+                    types.add(type(value))
+
+    fields = []
+    for name, types in seen.items():
+        if name == "captured_data":
+            arrow_type = pa.large_string()
+        elif types <= {bool} and types:
+            arrow_type = pa.bool_()
+        elif types <= {int} and types:
+            arrow_type = pa.int64()
+        elif types <= {int, float} and types:
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+# Record columns with only a handful of distinct values per export
+_DICTIONARY_COLUMNS = frozenset({"experiment_id", "status"})
+
+
+def _with_dictionary_columns(schema: "pa.Schema") -> "pa.Schema":
+    """Dictionary-encode the low-cardinality string columns of a schema."""
+    pa = _import_pyarrow()
+
+    for i, field in enumerate(schema):
+        if field.name in _DICTIONARY_COLUMNS and field.type == pa.string():
+            schema = schema.set(
+                i, field.with_type(pa.dictionary(pa.int32(), pa.string()))
             )
+    return schema
+
+
+def _to_text(value: Any) -> str | None:
+    """Render a value for a text column (JSON for containers)."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+def _columns_to_arrays(
+    columns: dict[str, list[Any]],
+    schema: "pa.Schema",
+    num_rows: int,
+) -> list["pa.Array"]:
+    """Build one Arrow array per schema field from column buffers."""
+    pa = _import_pyarrow()
+
+    arrays = []
+    for field in schema:
+        values = columns.get(field.name)
+        if values is None:
+            arrays.append(pa.nulls(num_rows, field.type))
+            continue
+        if field.type == pa.string():
+            values = [_to_text(v) for v in values]
+        arrays.append(pa.array(values, type=field.type))
+    return arrays
 
-        if include_data:
-            mapping = captured_data_json or {}
-            row["captured_data"] = mapping.get(run.record.run_id)
 
-        if include_params:
-            for key, value in run.params.items():
-                row[f"param_{key}"] = value
+def runs_to_arrow_table(
+    runs: list[RunResponse],
+    include_params: bool = True,
+    include_metrics: bool = True,
+    include_derived: bool = True,
+    include_record: bool = True,
+    include_data: bool = True,
+    captured_data_json: list[str | None] | None = None,
+) -> "pa.Table":
+    """
+    Flatten runs directly to a pyarrow Table (no pandas round-trip).
 
-        if include_metrics:
-            for key, value in run.metrics.items():
-                row[key] = value
+    Uses the same column layout as runs_to_dataframe(). Each column is
+    built with pa.array() from its own value list, so type inference is
+    per homogeneous column rather than per Python object in a DataFrame.
 
-        if include_derived:
-            for key, value in run.derived_metrics.items():
-                row[f"derived_{key}"] = value
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _import_pyarrow()
+
+    extractors = _field_extractors(
+        include_params=include_params,
+        include_metrics=include_metrics,
+        include_derived=include_derived,
+        include_record=include_record,
+    )
+    captured_data = _captured_data_column(runs, include_data, captured_data_json)
+    schema = _scan_arrow_schema(runs, extractors, captured_data is not None)
+    columns = _runs_to_columns(runs, extractors, captured_data)
+    return pa.Table.from_arrays(
+        _columns_to_arrays(columns, schema, len(runs)), schema=schema
+    )
+
+
+class _ChunkSink:
+    """Write-only file object that hands back what was written since the last take().
+
+    tell() keeps counting across take() calls, so the Parquet writer's
+    footer offsets stay correct while earlier bytes are already sent.
+    """
 
-        rows.append(row)
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._position = 0
+        self.closed = False
 
-    return pd.DataFrame(rows)
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
 
+    def tell(self) -> int:
+        return self._position
 
-def dataframe_to_csv_bytes(df: "pd.DataFrame") -> bytes:
+    def flush(self) -> None:
+        pass
+
+    def writable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def iter_parquet_chunks(
+    runs: list[RunResponse],
+    metadata: dict[bytes, bytes],
+    include_params: bool = True,
+    include_metrics: bool = True,
+    include_derived: bool = True,
+    include_record: bool = True,
+    include_data: bool = True,
+    captured_data_json: list[str | None] | None = None,
+    chunk_size: int = 10_000,
+) -> Iterator[bytes]:
     """
-    Export DataFrame to CSV bytes.
+    Export runs to zstd-compressed Parquet, yielding the file piece by piece.
+
+    Each chunk of ``chunk_size`` runs is written as one row group and its
+    bytes are yielded right away (the footer comes last), so a response
+    can start sending before the whole file exists. Every chunk is written
+    with the schema scanned from all runs; experiment_id and status are
+    dictionary-encoded.
+
+    pyarrow is imported and the schema scanned before this returns, so a
+    missing dependency raises here rather than mid-stream.
 
     Args:
-        df: pandas DataFrame to export.
+        runs: List of RunResponse objects to export.
+        metadata: Metadata key-value pairs to embed (from build_export_metadata).
+        chunk_size: Number of runs converted and written per row group.
+
+    Returns:
+        Iterator over the Parquet file content.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    extractors = _field_extractors(
+        include_params=include_params,
+        include_metrics=include_metrics,
+        include_derived=include_derived,
+        include_record=include_record,
+    )
+    captured_data = _captured_data_column(runs, include_data, captured_data_json)
+    schema = _with_dictionary_columns(
+        _scan_arrow_schema(runs, extractors, captured_data is not None)
+    ).with_metadata(metadata)
+
+    def generate() -> Iterator[bytes]:
+        sink = _ChunkSink()
+        with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+            for start in range(0, len(runs), chunk_size):
+                chunk = runs[start : start + chunk_size]
+                columns = _runs_to_columns(
+                    chunk,
+                    extractors,
+                    captured_data[start : start + chunk_size]
+                    if captured_data is not None
+                    else None,
+                )
+                writer.write_batch(
+                    pa.RecordBatch.from_arrays(
+                        _columns_to_arrays(columns, schema, len(chunk)),
+                        schema=schema,
+                    )
+                )
+                yield sink.take()
+        yield sink.take()
+
+    return generate()
+
+
+def runs_to_parquet_bytes(
+    runs: list[RunResponse],
+    metadata: dict[bytes, bytes],
+    include_params: bool = True,
+    include_metrics: bool = True,
+    include_derived: bool = True,
+    include_record: bool = True,
+    include_data: bool = True,
+    captured_data_json: list[str | None] | None = None,
+    chunk_size: int = 10_000,
+) -> bytes:
+    """
+    Export runs to zstd-compressed Parquet, one row group per chunk.
+
+    Collects iter_parquet_chunks() into a single bytes object.
+
+    Args:
+        runs: List of RunResponse objects to export.
+        metadata: Metadata key-value pairs to embed (from build_export_metadata).
+        chunk_size: Number of runs converted and written per batch.
+
+    Returns:
+        Parquet file content as bytes.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    return b"".join(
+        iter_parquet_chunks(
+            runs,
+            metadata,
+            include_params=include_params,
+            include_metrics=include_metrics,
+            include_derived=include_derived,
+            include_record=include_record,
+            include_data=include_data,
+            captured_data_json=captured_data_json,
+            chunk_size=chunk_size,
+        )
+    )
+
+
+def dataframe_to_csv_bytes(df: "pa.Table | pd.DataFrame") -> bytes:
+    """
+    Export a table to CSV bytes.
+
+    Uses Arrow's C++ CSV writer, which emits UTF-8 bytes directly instead
+    of building the whole CSV as a Python str and encoding it again.
+
+    Args:
+        df: pyarrow Table (from runs_to_arrow_table) or pandas DataFrame.
 
     Returns:
         CSV content as bytes.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
     """
-    return df.to_csv(index=False).encode("utf-8")
+    pa = _import_pyarrow()
+    import pyarrow.csv as pacsv
+
+    table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(
+        df, preserve_index=False
+    )
+
+    sink = pa.BufferOutputStream()
+    pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(include_header=True))
+    return sink.getvalue().to_pybytes()
 
 
 def dataframe_to_parquet_bytes(
-    df: "pd.DataFrame",
-    metadata: dict[str, str],
+    df: "pa.Table | pd.DataFrame",
+    metadata: dict[bytes, bytes],
 ) -> bytes:
     """
-    Export DataFrame to Parquet with embedded metadata.
+    Export a table to Parquet with embedded metadata.
 
     Uses PyArrow to write Parquet with custom schema metadata,
     enabling self-documenting files with provenance information.
 
     Args:
-        df: pandas DataFrame to export.
-        metadata: Dict of metadata key-value pairs to embed.
-            Keys and values should be strings.
+        df: pyarrow Table (from runs_to_arrow_table) or pandas DataFrame.
+        metadata: Metadata key-value pairs to embed (from build_export_metadata).
 
     Returns:
         Parquet file content as bytes.
@@ -160,22 +597,18 @@ def dataframe_to_parquet_bytes(
     Raises:
         ImportError: If pyarrow is not installed.
     """
-    try:
-        import pyarrow as pa
-        import pyarrow.parquet as pq
-    except ImportError as e:
-        raise ImportError(
-            "pyarrow is required for Parquet export. "
-            "Install with: pip install pyarrow"
-        ) from e
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
 
-    # Convert DataFrame to Arrow Table
-    table = pa.Table.from_pandas(df)
+    # Tables built by runs_to_arrow_table already carry an explicit schema;
+    # DataFrames are converted without the pandas index column.
+    table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(
+        df, preserve_index=False
+    )
 
-    # Embed custom metadata (keys/values must be bytes)
-    custom_meta = {k.encode(): v.encode() for k, v in metadata.items()}
+    # Embed custom metadata (already encoded as Arrow expects)
     existing_meta = table.schema.metadata or {}
-    table = table.replace_schema_metadata({**existing_meta, **custom_meta})
+    table = table.replace_schema_metadata({**existing_meta, **metadata})
 
     # Write to buffer
     buffer = BytesIO()
@@ -187,17 +620,20 @@ def build_export_metadata(
     experiment_id: str,
     total_runs: int,
     context_fingerprint: str | None = None,
-) -> dict[str, str]:
+) -> dict[bytes, bytes]:
     """
     Build metadata dict for Parquet export.
 
+    Keys and values are UTF-8 bytes, the form Arrow schema metadata uses,
+    so they can be attached without re-encoding.
+
     Args:
         experiment_id: Full experiment ID (e.g., 'optbench:v1').
         total_runs: Number of runs in the export.
         context_fingerprint: Optional context fingerprint from manifest.
 
     Returns:
-        Dict of metadata key-value pairs.
+        Dict of metadata key-value pairs (bytes).
     """
     # Parse experiment_id into name and version
     if ":" in experiment_id:
@@ -206,15 +642,15 @@ def build_export_metadata(
         name, version = experiment_id, ""
 
     metadata = {
-        "experiment_id": experiment_id,
-        "experiment_name": name,
-        "experiment_version": version,
-        "total_runs": str(total_runs),
-        "exported_at": datetime.now().isoformat(),
-        "atlas_version": "0.1.0",
+        b"experiment_id": experiment_id.encode(),
+        b"experiment_name": name.encode(),
+        b"experiment_version": version.encode(),
+        b"total_runs": str(total_runs).encode(),
+        b"exported_at": datetime.now().isoformat().encode(),
+        b"atlas_version": b"0.1.0",
     }
 
     if context_fingerprint:
-        metadata["context_fingerprint"] = context_fingerprint
+        metadata[b"context_fingerprint"] = context_fingerprint.encode()
 
     return metadata
@@ -10,9 +10,11 @@ Or using the CLI:
 
 import json
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import Response
 
@@ -24,6 +26,7 @@ logging.basicConfig(
 # Reduce noise from other libraries
 logging.getLogger("uvicorn").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
@@ -40,10 +43,28 @@ from atlas.routers import (
 # Path to bundled static files
 STATIC_DIR = Path(__file__).parent / "static"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the store adapter once at startup unless the CLI already did."""
+    from atlas.deps import init_store
+
+    if getattr(app.state, "store", None) is None:
+        try:
+            app.state.store = init_store()
+        except Exception as e:
+            # Keep serving /api/health and the SPA; store routes raise the
+            # error from get_store() on first use instead
+            logger.error(f"Store not initialized at startup: {e}")
+            app.state.store = None
+    yield
+
+
 app = FastAPI(
     title="MetaLab Atlas",
     description="Dashboard API for exploring metalab experiment runs",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS for local frontend development
@@ -63,6 +84,16 @@ app.add_middleware(
 )
 
 
+def _pretty_json(body: bytes) -> bytes:
+    """Re-indent a JSON body (2 spaces, UTF-8 kept as-is)."""
+    try:
+        return orjson.dumps(orjson.loads(body), option=orjson.OPT_INDENT_2)
+    except (orjson.JSONDecodeError, orjson.JSONEncodeError):
+        # e.g. NaN/Infinity literals from JSONResponse, which stdlib json accepts
+        data = json.loads(body)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
 class PrettyJSONMiddleware:
     """Pure ASGI middleware to pretty-print JSON responses when ?pretty=true is passed."""
 
@@ -70,80 +101,71 @@ class PrettyJSONMiddleware:
         self.app = app
 
     async def __call__(self, scope, receive, send):
-        if scope["type"] != "http":
+        # Only API routes return JSON; static assets and the SPA never wrap
+        if scope["type"] != "http" or not scope.get("path", "").startswith("/api/"):
             await self.app(scope, receive, send)
             return
 
-        # Check for ?pretty=true in query string
-        query_string = scope.get("query_string", b"").decode()
-        if "pretty=true" not in query_string:
+        # Check for ?pretty=true in the raw query string (no decode needed)
+        if b"pretty=true" not in scope.get("query_string", b""):
             await self.app(scope, receive, send)
             return
 
         # Intercept response to pretty-print JSON
-        response_started = False
-        response_headers = []
-        response_status = 200
+        start_message = None
         body_parts = []
-        content_type = ""
+        passthrough = False
 
         async def send_wrapper(message):
-            nonlocal response_started, response_headers, response_status, content_type
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
 
             if message["type"] == "http.response.start":
-                response_started = True
-                response_status = message["status"]
-                response_headers = list(message.get("headers", []))
-                # Extract content-type
-                for name, value in response_headers:
+                content_type = b""
+                for name, value in message.get("headers", ()):
                     if name.lower() == b"content-type":
-                        content_type = value.decode()
+                        content_type = value
                         break
+                if b"application/json" not in content_type:
+                    # Nothing to rewrite (files, HTML, downloads): stream as-is
+                    passthrough = True
+                    await send(message)
+                    return
                 # Don't send yet - wait to see if we need to modify
+                start_message = message
                 return
 
             elif message["type"] == "http.response.body":
-                body = message.get("body", b"")
-                more_body = message.get("more_body", False)
-                body_parts.append(body)
-
-                if not more_body:
-                    # Complete response - check if JSON and pretty-print
-                    full_body = b"".join(body_parts)
-
-                    if "application/json" in content_type:
-                        try:
-                            data = json.loads(full_body)
-                            full_body = json.dumps(
-                                data, indent=2, ensure_ascii=False
-                            ).encode()
-                            # Update content-length header
-                            response_headers = [
-                                (name, value)
-                                for name, value in response_headers
-                                if name.lower() != b"content-length"
-                            ]
-                            response_headers.append(
-                                (b"content-length", str(len(full_body)).encode())
-                            )
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            pass  # Keep original body
-
-                    # Now send the response
-                    await send(
-                        {
-                            "type": "http.response.start",
-                            "status": response_status,
-                            "headers": response_headers,
-                        }
-                    )
-                    await send(
-                        {
-                            "type": "http.response.body",
-                            "body": full_body,
-                            "more_body": False,
-                        }
-                    )
+                body_parts.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+
+                # Complete JSON response - pretty-print
+                full_body = b"".join(body_parts)
+                try:
+                    full_body = _pretty_json(full_body)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # Keep the original body and its headers untouched
+                    await send(start_message)
+                else:
+                    headers = [
+                        (name, value)
+                        for name, value in start_message.get("headers", ())
+                        if name.lower() != b"content-length"
+                    ]
+                    headers.append((b"content-length", str(len(full_body)).encode()))
+                    await send({**start_message, "headers": headers})
+
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": full_body,
+                        "more_body": False,
+                    }
+                )
 
         await self.app(scope, receive, send_wrapper)
 
@@ -11,9 +11,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # =============================================================================
 # Enums
@@ -133,6 +134,19 @@ class RecordFields(BaseModel):
     warnings: list[dict[str, Any]] = Field(default_factory=list)
     notes: str | None = None
 
+    # Records are not mutated after they are loaded, so the ISO renderings
+    # are computed once per instance and reused by every export.
+
+    @cached_property
+    def started_at_iso(self) -> str:
+        """started_at as an ISO 8601 string."""
+        return self.started_at.isoformat()
+
+    @cached_property
+    def finished_at_iso(self) -> str | None:
+        """finished_at as an ISO 8601 string (None while running)."""
+        return self.finished_at.isoformat() if self.finished_at else None
+
 
 # =============================================================================
 # Artifact Models
@@ -189,6 +203,22 @@ class ArtifactPreview(BaseModel):
     content_available: bool = True
 
 
+class LogListResponse(BaseModel):
+    """Available log names for a run."""
+
+    run_id: str
+    logs: list[str]
+
+
+class LogContentResponse(BaseModel):
+    """Log content for a run (empty if the log doesn't exist)."""
+
+    run_id: str
+    log_name: str
+    content: str
+    exists: bool
+
+
 # =============================================================================
 # Run Response Models
 # =============================================================================
@@ -220,6 +250,10 @@ class RunListResponse(BaseModel):
     )
     limit: int
     offset: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as ?cursor= to fetch the next page (None on the last page)",
+    )
 
 
 # =============================================================================
@@ -552,15 +586,40 @@ class DataEntryResponse(BaseModel):
 # =============================================================================
 
 
+# Navigation target of a hit / group
+SearchScope = Literal["experiment", "run"]
+
+SearchCategory = Literal[
+    "experiments",
+    "runs",
+    "field_names",
+    "param_names",
+    "metric_names",
+    "derived_names",
+    "param_values",
+    "metric_values",
+    "derived_values",
+    "fingerprints",
+    "artifacts",
+    "tags",
+    "run_tags",
+    "logs",
+]
+
+
 class SearchHit(BaseModel):
     """Single search result item."""
 
+    model_config = ConfigDict(frozen=True)
+
     label: str = Field(..., description="Display text (e.g., experiment id, run id)")
     sublabel: str | None = Field(
         default=None,
         description="Secondary text (e.g., '42 runs', 'in experiment: foo')",
     )
-    entity_type: str = Field(..., description="'experiment' or 'run' for navigation")
+    entity_type: SearchScope = Field(
+        ..., description="'experiment' or 'run' for navigation"
+    )
     entity_id: str = Field(..., description="experiment_id or run_id for navigation")
     field: str | None = Field(
         default=None,
@@ -575,12 +634,14 @@ class SearchHit(BaseModel):
 class SearchGroup(BaseModel):
     """Categorized group of search hits."""
 
-    category: str = Field(
+    model_config = ConfigDict(frozen=True)
+
+    category: SearchCategory = Field(
         ...,
         description="Category key: experiments, runs, param_names, param_values, etc.",
     )
     label: str = Field(..., description="Display label for the group header")
-    scope: str = Field(
+    scope: SearchScope = Field(
         ..., description="'experiment' or 'run' -- determines navigation behavior"
     )
     hits: list[SearchHit] = Field(default_factory=list)
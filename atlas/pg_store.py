@@ -7,6 +7,12 @@ Provides SQL pushdown for efficient queries on large datasets (300k+ runs):
 - Field index: From field_catalog table or JSONB introspection
 - Aggregations: SQL-based GROUP BY with statistical functions
 
+Numeric params/metrics filters and metrics sorting all compare
+`(record_json->'metrics'->>'<key>')::float` (or 'params_resolved'); an
+expression index for a hot key should be created on exactly that, e.g.
+    CREATE INDEX ON <schema>.runs (((record_json->'metrics'->>'loss')::float));
+(see also the auto_sort_index option).
+
 Connection can be via:
 - Direct connection string: postgresql://user@host:port/db
 - SSH tunnel (handled externally before calling this adapter)
@@ -14,15 +20,26 @@ Connection can be via:
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import json
 import logging
 import mimetypes
-from contextlib import contextmanager
-from datetime import datetime, timezone
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generator
-from urllib.parse import parse_qs, urlparse
+from typing import TYPE_CHECKING, Any, Generator, Literal
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import orjson
 
+from atlas.capabilities import StoreCapabilities
 from atlas.models import (
     ArtifactInfo,
     ArtifactPreview,
@@ -68,6 +85,207 @@ class ContentUnavailableError(Exception):
 DEFAULT_PAGE_SIZE = 100
 MAX_PAGE_SIZE = 1000
 
+# record_json->'artifacts' with "_"-prefixed (private) metadata keys removed
+# server-side; always a JSON array, in the original order
+_ARTIFACTS_SQL = """(
+    SELECT COALESCE(jsonb_agg(
+        a || jsonb_build_object('metadata', COALESCE((
+            SELECT jsonb_object_agg(m.key, m.value)
+            FROM jsonb_each(
+                CASE WHEN jsonb_typeof(a->'metadata') = 'object'
+                     THEN a->'metadata' ELSE '{}'::jsonb END
+            ) AS m
+            WHERE left(m.key, 1) <> '_'
+        ), '{}'::jsonb))
+        ORDER BY arts.ord
+    ), '[]'::jsonb)
+    FROM jsonb_array_elements(
+        CASE WHEN jsonb_typeof(r.record_json->'artifacts') = 'array'
+             THEN r.record_json->'artifacts' ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS arts(a, ord)
+)"""
+
+# jsonb_typeof() -> field type for JSONB field introspection
+_JSON_FIELD_TYPES = {
+    "number": FieldType.NUMERIC,
+    "string": FieldType.STRING,
+    "boolean": FieldType.BOOLEAN,
+}
+
+# Fallback started_at for rows that never recorded one
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+# Seconds before the experiment -> schema mapping is rebuilt in full
+SCHEMA_CACHE_TTL = 300
+
+# Run -> (schema, experiment_id) lookups remembered by _locate_run
+RUN_SCHEMA_CACHE_SIZE = 10_000
+
+# How query_runs computes its total (see query_runs_page)
+CountMode = Literal["exact", "estimate", "cached"]
+_COUNT_CACHE_MAX_ENTRIES = 256
+
+# Planner row estimate summed over the runs tables; NULL if any table
+# has never been analyzed (reltuples = -1)
+_ESTIMATE_COUNT_SQL = """
+    SELECT CASE WHEN bool_or(reltuples < 0) THEN NULL
+                ELSE SUM(reltuples)::bigint END
+    FROM pg_class
+    WHERE oid = ANY(%s::regclass[])
+"""
+
+
+# =========================================================================
+# Field filter operators
+# =========================================================================
+
+
+def _contains_pattern(value: Any) -> str:
+    return f"%{value}%"
+
+
+def _same(value: Any) -> Any:
+    return value
+
+
+@lru_cache(maxsize=128)
+def _in_placeholders(n: int) -> str:
+    return ", ".join(["%s"] * n)
+
+
+# op -> (SQL template, value transform). {p} is the column or JSON path
+# expression; {values} is the placeholder list for "in", whose transform
+# applies to each element.
+_OpTable = dict[str, tuple[str, Any]]
+
+# record.* fields stored as runs table columns
+_COLUMN_OPS: _OpTable = {
+    "eq": ("{p} = %s", _same),
+    "ne": ("{p} != %s", _same),
+    "lt": ("{p} < %s", _same),
+    "le": ("{p} <= %s", _same),
+    "gt": ("{p} > %s", _same),
+    "ge": ("{p} >= %s", _same),
+    "contains": ("{p}::text ILIKE %s", _contains_pattern),
+    "in": ("{p} IN ({values})", _same),
+}
+
+# record.* fields that only live in record_json (tags, warnings, notes, ...);
+# ordering comparisons are not meaningful for these
+_RECORD_JSON_OPS: _OpTable = {
+    "eq": ("{p} = %s", str),
+    "ne": ("{p} != %s", str),
+    "contains": ("{p} ILIKE %s", _contains_pattern),
+    "in": ("{p} IN ({values})", str),
+}
+
+# params.* / metrics.* text paths (->>)
+_JSONB_OPS: _OpTable = {
+    "eq": ("{p} = %s", str),
+    "ne": ("{p} != %s", str),
+    "lt": ("({p})::float < %s", float),
+    "le": ("({p})::float <= %s", float),
+    "gt": ("({p})::float > %s", float),
+    "ge": ("({p})::float >= %s", float),
+    "contains": ("{p} ILIKE %s", _contains_pattern),
+    "in": ("{p} IN ({values})", str),
+}
+
+# eq/ne against a number compare numerically to avoid int/float text
+# mismatch (e.g., JSON -80 extracts as '-80' but str(-80.0) == '-80.0').
+# Every numeric comparison uses the same ::float cast as the metrics sort,
+# so one expression index serves sorting and filtering.
+_JSONB_NUMERIC_OPS: _OpTable = {
+    **_JSONB_OPS,
+    "eq": ("({p})::float = %s", float),
+    "ne": ("({p})::float != %s", float),
+}
+
+
+# Serves experiment_id filters ordered by the default started_at DESC sort
+# (runs list, JSONB field sampling) as an index range scan
+_EXPERIMENT_STARTED_INDEX = (
+    "idx_runs_exp_started",
+    "(experiment_id, started_at DESC)",
+)
+
+
+def _sort_index(sort_expr: str) -> tuple[str, str]:
+    """
+    (name, definition) of a btree index on a params/metrics sort expression.
+
+    ORDER BY on a record_json path has no index by default, so every page
+    sorts the whole filtered set. The index is built on exactly the
+    expression query_runs_page orders by, so the planner can use it.
+    """
+    digest = hashlib.md5(sort_expr.encode()).hexdigest()[:12]
+    return f"idx_runs_sort_{digest}", f"(({sort_expr}))"
+
+
+class _RefreshingCache:
+    """
+    TTL cache that serves stale entries while one thread refreshes them.
+
+    Within ``ttl`` an entry is returned as is. Between ``ttl`` and
+    ``hard_ttl`` it is still returned immediately, and a single background
+    thread per key reloads it (stale-while-revalidate), so polling clients
+    never wait on the reload and concurrent callers don't all re-query.
+    Missing or hard-expired entries are loaded synchronously.
+    """
+
+    def __init__(self, ttl: float, hard_ttl: float) -> None:
+        self.ttl = ttl
+        self.hard_ttl = hard_ttl
+        self._entries: dict[Any, tuple[float, Any]] = {}
+        self._refreshing: set[Any] = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, load: Any) -> Any:
+        """Return the cached value for key, calling load() as needed."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetched_at, value = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl:
+                return value
+            if age < self.hard_ttl:
+                self._refresh_in_background(key, load)
+                return value
+        value = load()
+        self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def _refresh_in_background(self, key: Any, load: Any) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._entries[key] = (time.monotonic(), load())
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed for {key!r}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="atlas-cache-refresh", daemon=True).start()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@lru_cache(maxsize=256)
+def _table_sql(schemas: tuple[str, ...], name: str, alias: str | None) -> str:
+    """FROM-clause reference for SchemaScope.table (memoized per scope)."""
+    if len(schemas) == 1:
+        base = f"{schemas[0]}.{name}"
+        return f"{base} {alias}" if alias else base
+    union_parts = [f"SELECT * FROM {s}.{name}" for s in schemas]
+    table_alias = alias if alias else f"all_{name}"
+    return f"({' UNION ALL '.join(union_parts)}) AS {table_alias}"
+
 
 class SchemaScope:
     """
@@ -126,12 +344,7 @@ class SchemaScope:
         """
         if len(self._schemas) == 0:
             raise ValueError("Cannot create table reference for empty scope")
-        if len(self._schemas) == 1:
-            base = f"{self._schemas[0]}.{name}"
-            return f"{base} {alias}" if alias else base
-        union_parts = [f"SELECT * FROM {s}.{name}" for s in self._schemas]
-        table_alias = alias if alias else f"all_{name}"
-        return f"({' UNION ALL '.join(union_parts)}) AS {table_alias}"
+        return _table_sql(tuple(self._schemas), name, alias)
 
     def single_schema(self) -> str | None:
         """
@@ -149,11 +362,15 @@ class SchemaScope:
 # Custom query parameters that metalab embeds in the connection URL but
 # that are not valid PostgreSQL connection parameters.  These must be
 # stripped before the URL is handed to psycopg / libpq.
-_CUSTOM_QUERY_PARAMS = {"file_root", "schema"}
+_CUSTOM_QUERY_PARAMS = {"file_root", "schema", "auto_sort_index"}
 
 
+@lru_cache(maxsize=16)
 def _parse_postgres_url(url: str) -> dict[str, Any]:
-    """Parse a Postgres connection URL into components."""
+    """Parse a Postgres connection URL into components.
+
+    Memoized per URL; treat the returned dict as read-only.
+    """
     parsed = urlparse(url)
 
     params = {}
@@ -169,9 +386,11 @@ def _parse_postgres_url(url: str) -> dict[str, Any]:
         "dbname": parsed.path.lstrip("/") if parsed.path else "metalab",
         "schema": params.get("schema", "public"),
         "file_root": params.get("file_root"),
+        "auto_sort_index": params.get("auto_sort_index", "").lower() in ("1", "true", "yes"),
     }
 
 
+@lru_cache(maxsize=16)
 def _clean_postgres_url(url: str) -> str:
     """Return a connection URL safe for psycopg (custom params stripped)."""
     parsed = urlparse(url)
@@ -182,16 +401,142 @@ def _clean_postgres_url(url: str) -> str:
     original = parse_qs(parsed.query)
     cleaned = {k: v for k, v in original.items() if k not in _CUSTOM_QUERY_PARAMS}
 
-    if cleaned:
-        from urllib.parse import urlencode
-
-        new_query = urlencode(cleaned, doseq=True)
-    else:
-        new_query = ""
+    new_query = urlencode(cleaned, doseq=True) if cleaned else ""
 
     return parsed._replace(query=new_query).geturl()
 
 
+def _configure_connection(conn: Any) -> None:
+    """
+    Per-connection setup for pooled connections.
+
+    Pins the json/jsonb loaders (text and binary) to orjson, so JSON
+    columns and ->'key' projections always arrive as Python objects,
+    parsed once, and row conversion never has to json.loads them again.
+    """
+    from psycopg.types.json import set_json_loads  # type: ignore[import-not-found]
+
+    set_json_loads(orjson.loads, conn)
+
+
+def _pipeline(conn: Any) -> Any:
+    """Enter pipeline mode on conn when libpq supports it (no-op otherwise).
+
+    Statements executed inside are sent without waiting for each result,
+    so N independent queries cost one round trip instead of N.
+    """
+    import psycopg  # type: ignore[import-not-found]
+
+    return conn.pipeline() if psycopg.Pipeline.is_supported() else nullcontext()
+
+
+def _matches_nothing(filter: FilterSpec) -> bool:
+    """True if the filter is structurally unsatisfiable (an empty IN list)."""
+    return any(
+        ff.op.value == "in" and not ff.value for ff in filter.field_filters or ()
+    )
+
+
+_SORT_KEY_RE = re.compile(r"[\w.\-]+")
+
+
+@lru_cache(maxsize=256)
+def _resolve_sort(sort_by: str | None) -> tuple[str, bool]:
+    """
+    Map a sort_by field path to (SQL sort expression, is record_json path).
+
+    params.*/metrics.* keys are interpolated into the SQL, so they must
+    match _SORT_KEY_RE; record.* must name a runs table column. Other
+    namespaces (e.g. derived.*) keep the default started_at ordering.
+
+    Raises:
+        ValueError: For an unknown record column or an unsafe key.
+    """
+    namespace, _, key = (sort_by or "").partition(".")
+    if namespace == "record":
+        if key not in PostgresStoreAdapter._RECORD_TABLE_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort_by}")
+        return f"r.{key}", False
+    if namespace in ("params", "metrics"):
+        if not _SORT_KEY_RE.fullmatch(key):
+            raise ValueError(f"Cannot sort by {sort_by}")
+        if namespace == "params":
+            return f"(record_json->'params_resolved'->>'{key}')", True
+        return f"(record_json->'metrics'->>'{key}')::float", True
+    return "r.started_at", False
+
+
+def _encode_run_cursor(
+    sort_by: str | None, sort_order: str, sort_value: Any, run_id: str
+) -> str:
+    """
+    Opaque keyset cursor pointing just past the row (sort_value, run_id).
+
+    The sort it was taken under is kept in the cursor, so it can't be
+    replayed against a different ordering (see _decode_run_cursor).
+    """
+    sort_dir = "desc" if sort_order == "desc" else "asc"
+    return base64.urlsafe_b64encode(
+        orjson.dumps([sort_by, sort_dir, sort_value, run_id], default=str)
+    ).decode("ascii")
+
+
+def _decode_run_cursor(
+    cursor: str, sort_by: str | None, sort_order: str
+) -> tuple[Any, str]:
+    """
+    Decode a cursor from _encode_run_cursor() for the requested sort.
+
+    Raises:
+        ValueError: If the cursor is malformed, its sort value is not a
+            scalar, or it was issued for a different sort_by/sort_order.
+    """
+    try:
+        cursor_sort_by, cursor_dir, sort_value, run_id = orjson.loads(
+            base64.urlsafe_b64decode(cursor)
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    # Only scalars compare against a sort column (bool is an int subclass)
+    scalar = sort_value is None or (
+        isinstance(sort_value, (str, int, float)) and not isinstance(sort_value, bool)
+    )
+    if not isinstance(run_id, str) or not scalar:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    sort_dir = "desc" if sort_order == "desc" else "asc"
+    if cursor_sort_by != sort_by or cursor_dir != sort_dir:
+        raise ValueError(
+            "Cursor was issued for a different sort_by/sort_order; "
+            "restart pagination without a cursor"
+        )
+    return sort_value, run_id
+
+
+def _keyset_clause(
+    sort_col: str, sort_dir: str, sort_value: Any, run_id: str
+) -> tuple[str, list[Any]]:
+    """
+    WHERE clause selecting the rows after (sort_value, run_id).
+
+    Mirrors ORDER BY sort_col, r.run_id in Postgres' default NULL placement:
+    NULL sort values come first when descending and last when ascending.
+    """
+    if sort_value is None:
+        if sort_dir == "DESC":
+            return (
+                f"(({sort_col}) IS NULL AND r.run_id < %s"
+                f" OR ({sort_col}) IS NOT NULL)",
+                [run_id],
+            )
+        return f"(({sort_col}) IS NULL AND r.run_id > %s)", [run_id]
+
+    op = "<" if sort_dir == "DESC" else ">"
+    clause = f"(({sort_col}), r.run_id) {op} (%s, %s)"
+    if sort_dir == "ASC":
+        clause = f"({clause} OR ({sort_col}) IS NULL)"
+    return clause, [sort_value, run_id]
+
+
 class PostgresStoreAdapter:
     """
     Store adapter that queries Postgres directly.
@@ -206,6 +551,9 @@ class PostgresStoreAdapter:
         *,
         connect_timeout: float = 10.0,
         file_root: str | None = None,
+        auto_sort_index: bool | None = None,
+        pool_min_size: int = 1,
+        pool_max_size: int | None = None,
     ) -> None:
         """
         Initialize with Postgres connection.
@@ -214,6 +562,15 @@ class PostgresStoreAdapter:
             connection_string: PostgreSQL connection URL.
             connect_timeout: Connection timeout in seconds.
             file_root: Root directory for files (logs, artifacts).
+            auto_sort_index: Create an (experiment_id, started_at DESC)
+                index on first use, and an expression index the first time
+                the runs list is sorted by a params.*/metrics.* field (see
+                _ensure_indexes). Defaults to the URL's
+                ``?auto_sort_index=true``; off otherwise.
+            pool_min_size: Connections kept open in the pool.
+            pool_max_size: Pool ceiling; defaults to min(32, 4 * CPU count).
+                Route handlers run in FastAPI's threadpool, so this bounds
+                how many requests query Postgres concurrently.
         """
         try:
             import psycopg  # type: ignore[import-not-found]
@@ -225,22 +582,44 @@ class PostgresStoreAdapter:
 
         self._connection_string = _clean_postgres_url(connection_string)
         self._connect_timeout = connect_timeout
+        self._pool_min_size = pool_min_size
+        self._pool_max_size = pool_max_size or min(32, (os.cpu_count() or 1) * 4)
 
         # Parse URL for config (uses original URL so custom params are visible)
         config = _parse_postgres_url(connection_string)
         self._schema = config["schema"]
         self._file_root = file_root or config.get("file_root")
+        # Built once; per-request path handling joins onto this
+        self._file_root_path = Path(self._file_root) if self._file_root else None
+        self._auto_sort_index = (
+            config["auto_sort_index"] if auto_sort_index is None else auto_sort_index
+        )
+        # (schema, index name) pairs already created or being created
+        self._created_indexes: set[tuple[str, str]] = set()
 
         # Connection pool (lazy)
         self._pool: psycopg.ConnectionPool | None = None
 
-        # Cache of experiment_id -> schema mapping
-        self._experiment_schemas: dict[str, str] = {}
+        # Cache of experiment_id -> schema mapping; None marks an experiment
+        # known to be missing. Rebuilt in full once it expires.
+        self._experiment_schemas: dict[str, str | None] = {}
+        self._schema_cache_expires_at = datetime.min.replace(tzinfo=timezone.utc)
+        # Distinct schemas of the mapping above, sorted; rebuilt with it
+        self._all_schemas_cache: list[str] | None = None
+        # LRU of run_id -> (schema, experiment_id) (see _locate_run)
+        self._run_schemas: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._run_schemas_lock = threading.Lock()
 
         # TTL caches to avoid redundant DB queries from frontend polling
-        self._field_index_cache: dict[str | None, tuple[datetime, FieldIndex]] = {}
-        self._experiments_cache: tuple[datetime, list[tuple[str, int, datetime | None]]] | None = None
         self._cache_ttl = 60  # seconds
+        # Served stale (and refreshed in the background) for up to 10x TTL
+        self._field_index_cache = _RefreshingCache(self._cache_ttl, 10 * self._cache_ttl)
+        self._experiments_cache = _RefreshingCache(self._cache_ttl, 10 * self._cache_ttl)
+        # (schemas, where_sql, params) -> (cached_at, total) for query_runs
+        self._count_cache: dict[tuple, tuple[datetime, int]] = {}
+
+        # Optional capabilities (see atlas.capabilities)
+        self.caps = StoreCapabilities(search=self.search, refresh=self.refresh)
 
         # Verify connection
         self._ensure_connected()
@@ -252,6 +631,11 @@ class PostgresStoreAdapter:
             f"Connected to Postgres: {config['host']}:{config['port']}/{config['dbname']}"
         )
 
+    @property
+    def file_root(self) -> str | None:
+        """Root directory for experiment files (logs, artifacts), if configured."""
+        return self._file_root
+
     def _ensure_connected(self) -> None:
         """Ensure connection pool is initialized."""
         if self._pool is not None:
@@ -262,14 +646,21 @@ class PostgresStoreAdapter:
 
         self._pool = ConnectionPool(
             self._connection_string,
-            min_size=1,
-            max_size=5,
+            min_size=self._pool_min_size,
+            max_size=max(self._pool_max_size, self._pool_min_size),
             timeout=self._connect_timeout,
+            configure=_configure_connection,
         )
 
     @contextmanager
     def _get_conn(self) -> Generator["psycopg.Connection", None, None]:
-        """Get a connection from the pool."""
+        """
+        Get a connection from the pool.
+
+        Pooled connections outlive a request, so statements executed with
+        ``prepare=True`` stay prepared server-side (psycopg keeps an LRU of
+        them per connection, keyed by SQL text and so by schema).
+        """
         self._ensure_connected()
         assert self._pool is not None
         with self._pool.connection() as conn:
@@ -285,61 +676,150 @@ class PostgresStoreAdapter:
             with conn.cursor() as cur:
                 cur.execute(
                     """
-                    SELECT DISTINCT table_schema 
+                    SELECT DISTINCT table_schema,
+                        quote_ident(table_schema) = table_schema AS plain
                     FROM information_schema.tables 
                     WHERE table_name = 'runs'
                     AND table_schema NOT IN ('pg_catalog', 'information_schema')
                     ORDER BY table_schema
                 """
                 )
-                return [row[0] for row in cur.fetchall()]
+                schemas = []
+                for schema, plain in cur.fetchall():
+                    # Schema names are interpolated into SQL text, so only
+                    # names that need no quoting are used (quote_ident also
+                    # quotes reserved words such as "user" or "order")
+                    if plain:
+                        schemas.append(schema)
+                    else:
+                        logger.warning(f"Skipping schema with unquoted-unsafe name: {schema!r}")
+                return schemas
 
     def _refresh_schema_cache(self) -> None:
         """Build cache of experiment_id -> schema mapping."""
         schemas = self._discover_metalab_schemas()
-        self._experiment_schemas.clear()
-
-        with self._get_conn() as conn:
-            with conn.cursor() as cur:
-                for schema in schemas:
-                    cur.execute(
-                        f"""
-                        SELECT DISTINCT experiment_id FROM {schema}.runs
-                    """
-                    )
-                    for (exp_id,) in cur.fetchall():
-                        self._experiment_schemas[exp_id] = schema
-
+        # Built aside and swapped in whole: handlers run in worker threads,
+        # and a concurrent reader must never see a half-filled mapping
+        experiment_schemas: dict[str, str | None] = {}
+
+        if schemas:
+            # One round trip for all schemas. Ordered by schema name so an
+            # experiment present in several schemas maps to the last one,
+            # as with the previous per-schema loop.
+            union_sql = " UNION ALL ".join(
+                f"SELECT DISTINCT experiment_id, %s::text AS schema FROM {schema}.runs"
+                for schema in schemas
+            )
+            with self._get_conn() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(f"{union_sql} ORDER BY schema", schemas)
+                    for exp_id, schema in cur.fetchall():
+                        experiment_schemas[exp_id] = schema
+
+        self._experiment_schemas = experiment_schemas
+        self._all_schemas_cache = sorted(set(experiment_schemas.values()))
+        self._schema_cache_expires_at = datetime.now(timezone.utc) + timedelta(
+            seconds=SCHEMA_CACHE_TTL
+        )
         logger.info(
             f"Discovered {len(self._experiment_schemas)} experiments across {len(schemas)} schemas"
         )
 
+    def _schema_cache_expired(self) -> bool:
+        return datetime.now(timezone.utc) >= self._schema_cache_expires_at
+
     def _get_schema_for_experiment(self, experiment_id: str) -> str | None:
-        """Get the schema containing an experiment."""
-        if experiment_id not in self._experiment_schemas:
-            # Refresh cache in case it's a new experiment
+        """
+        Get the schema containing an experiment.
+
+        Hits and known misses are served from the cache until it expires.
+        An unknown experiment (e.g. created since the last refresh) is
+        probed on its own rather than rebuilding the whole mapping, and
+        the answer - including "not found" - is remembered.
+        """
+        if self._schema_cache_expired():
             self._refresh_schema_cache()
-        return self._experiment_schemas.get(experiment_id)
+        try:
+            return self._experiment_schemas[experiment_id]
+        except KeyError:
+            pass
+
+        schema = self._probe_experiment_schema(experiment_id)
+        self._experiment_schemas[experiment_id] = schema
+        known = self._all_schemas_cache or []
+        if schema is not None and schema not in known:
+            # A schema created since the last refresh
+            self._all_schemas_cache = sorted([*known, schema])
+        return schema
+
+    def _probe_experiment_schema(self, experiment_id: str) -> str | None:
+        """Find the schema holding one experiment, in a single round trip."""
+        schemas = self._discover_metalab_schemas()
+        if not schemas:
+            return None
+        probe_sql = " UNION ALL ".join(
+            f"SELECT %s::text AS schema WHERE EXISTS "
+            f"(SELECT 1 FROM {schema}.runs WHERE experiment_id = %s)"
+            for schema in schemas
+        )
+        params: list[Any] = []
+        for schema in schemas:
+            params.extend((schema, experiment_id))
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                # Last schema by name wins, matching _refresh_schema_cache
+                cur.execute(f"{probe_sql} ORDER BY schema DESC LIMIT 1", params)
+                row = cur.fetchone()
+        return row[0] if row else None
 
     def _get_all_schemas(self) -> list[str]:
-        """Get all known metalab schemas."""
-        if not self._experiment_schemas:
+        """Get all known metalab schemas (sorted; shared, do not mutate)."""
+        if not self._all_schemas_cache or self._schema_cache_expired():
             self._refresh_schema_cache()
-        return list(set(self._experiment_schemas.values()))
+        return self._all_schemas_cache or []
 
     def _find_schema_for_run(self, run_id: str) -> str | None:
         """Find which schema contains a given run_id."""
+        location = self._locate_run(run_id)
+        return location[0] if location else None
+
+    def _locate_run(self, run_id: str) -> tuple[str, str] | None:
+        """
+        Find (schema, experiment_id) for a run_id.
+
+        All schemas are probed in one UNION ALL query. Hits are kept in a
+        bounded LRU (a run never moves schema or experiment); misses are
+        not, since the run may still be written.
+        """
+        with self._run_schemas_lock:
+            location = self._run_schemas.get(run_id)
+            if location is not None:
+                self._run_schemas.move_to_end(run_id)
+                return location
+
         schemas = self._get_all_schemas()
+        if not schemas:
+            return None
+        probe_sql = " UNION ALL ".join(
+            f"(SELECT %s::text, experiment_id FROM {schema}.runs WHERE run_id = %s)"
+            for schema in schemas
+        )
+        params: list[Any] = []
+        for schema in schemas:
+            params.extend((schema, run_id))
         with self._get_conn() as conn:
             with conn.cursor() as cur:
-                for schema in schemas:
-                    cur.execute(
-                        f"SELECT 1 FROM {schema}.runs WHERE run_id = %s LIMIT 1",
-                        [run_id],
-                    )
-                    if cur.fetchone():
-                        return schema
-        return None
+                cur.execute(f"{probe_sql} LIMIT 1", params)
+                row = cur.fetchone()
+        if row is None:
+            return None
+
+        location = (row[0], row[1])
+        with self._run_schemas_lock:
+            self._run_schemas[run_id] = location
+            if len(self._run_schemas) > RUN_SCHEMA_CACHE_SIZE:
+                self._run_schemas.popitem(last=False)
+        return location
 
     # =========================================================================
     # Schema scope factory methods
@@ -376,20 +856,9 @@ class PostgresStoreAdapter:
         return SchemaScope([schema] if schema else [])
 
     def _get_experiment_id_for_run(self, run_id: str) -> str | None:
-        """Get experiment_id for a run_id."""
-        scope = self._scope_for_run(run_id)
-        schema = scope.single_schema()
-        if not schema:
-            return None
-
-        with self._get_conn() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"SELECT experiment_id FROM {schema}.runs WHERE run_id = %s",
-                    [run_id],
-                )
-                row = cur.fetchone()
-                return row[0] if row else None
+        """Get experiment_id for a run_id (cached with its schema)."""
+        location = self._locate_run(run_id)
+        return location[1] if location else None
 
     def _scope_all(self) -> SchemaScope:
         """
@@ -413,44 +882,102 @@ class PostgresStoreAdapter:
         offset: int = 0,
         *,
         cursor: str | None = None,
+        count_mode: CountMode = "cached",
     ) -> tuple[list[RunResponse], int]:
         """
         Query runs with filtering, sorting, and pagination.
 
-        Uses keyset pagination by default for efficiency.
-        Falls back to offset pagination if cursor not provided.
+        See query_runs_page() for cursor and count_mode handling; this
+        returns only (runs, total).
+        """
+        runs, total, _ = self.query_runs_page(
+            filter=filter,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
+        return runs, total
+
+    def query_runs_page(
+        self,
+        filter: FilterSpec | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "desc",
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        *,
+        cursor: str | None = None,
+        count_mode: CountMode = "cached",
+    ) -> tuple[list[RunResponse], int, str | None]:
+        """
+        Query one page of runs, returning (runs, total, next_cursor).
+
+        With a cursor (from a previous page's next_cursor), the page starts
+        right after that row via a keyset condition on (sort value, run_id),
+        so deep pages don't rescan the skipped rows; offset is ignored.
+        Without one, offset pagination is used. next_cursor is set when
+        the page is full (more rows may follow).
+
+        count_mode controls how total is computed:
+        - "exact": a COUNT(*) on every call.
+        - "cached": an exact count, reused for the cache TTL per
+          (scope, filter).
+        - "estimate": planner row estimate from pg_class.reltuples when no
+          filter applies (falls back to COUNT(*) otherwise, or when the
+          table has never been analyzed).
+
         Queries across all metalab schemas (or specific schema if experiment_id filtered).
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for another
+                sort, sort_by names an unknown record column or an
+                invalid params/metrics key, or a field filter names an
+                invalid params/metrics key.
         """
         limit = min(limit, MAX_PAGE_SIZE)
+        after = _decode_run_cursor(cursor, sort_by, sort_order) if cursor else None
+
+        # An empty "in" list matches nothing (and would render as invalid
+        # SQL "IN ()"): answer without a round trip. An empty status list
+        # means no status filter.
+        if filter and _matches_nothing(filter):
+            return [], 0, None
 
         # Get scope for this query
         scope = self._scope_for_experiment(filter.experiment_id if filter else None)
         if scope.is_empty:
-            return [], 0
+            return [], 0, None
 
+        last_row: list[Any] = []  # raw values of the last page row
         with self._get_conn() as conn:
-            with conn.cursor() as cur:
-                # Build WHERE clause (with r. prefix since SELECT joins with derived table)
-                where_clauses = []
-                params: list[Any] = []
+            with conn.cursor(
+                row_factory=self._run_row_factory(last_row)
+            ) as cur, conn.cursor() as count_cur:
+                # Build WHERE conditions as (clause, params) pairs
+                # (with r. prefix since SELECT joins with derived table)
+                conditions: list[tuple[str, list[Any]]] = []
 
                 if filter:
                     if filter.experiment_id:
-                        where_clauses.append("r.experiment_id = %s")
-                        params.append(filter.experiment_id)
+                        conditions.append(("r.experiment_id = %s", [filter.experiment_id]))
 
                     if filter.status:
-                        placeholders = ", ".join(["%s"] * len(filter.status))
-                        where_clauses.append(f"r.status IN ({placeholders})")
-                        params.extend(s.value for s in filter.status)
+                        placeholders = _in_placeholders(len(filter.status))
+                        conditions.append(
+                            (
+                                f"r.status IN ({placeholders})",
+                                [s.value for s in filter.status],
+                            )
+                        )
 
                     if filter.started_after:
-                        where_clauses.append("r.started_at >= %s")
-                        params.append(filter.started_after)
+                        conditions.append(("r.started_at >= %s", [filter.started_after]))
 
                     if filter.started_before:
-                        where_clauses.append("r.started_at <= %s")
-                        params.append(filter.started_before)
+                        conditions.append(("r.started_at <= %s", [filter.started_before]))
 
                     # Field filters on JSONB
                     if filter.field_filters:
@@ -463,8 +990,13 @@ class PostgresStoreAdapter:
                                     "record."
                                 ) and not clause.startswith("(r."):
                                     clause = "r." + clause
-                                where_clauses.append(clause)
-                                params.extend(fparams)
+                                conditions.append((clause, fparams))
+
+                # Canonical clause order: a filter shape always produces the
+                # same SQL text, so its prepared plan and cached count are reused
+                conditions.sort(key=lambda c: c[0])
+                where_clauses = [clause for clause, _ in conditions]
+                params: list[Any] = [p for _, cparams in conditions for p in cparams]
 
                 where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
 
@@ -476,23 +1008,38 @@ class PostgresStoreAdapter:
                     SELECT COUNT(*) FROM {runs_table}
                     WHERE {where_sql}
                 """
-                cur.execute(count_sql, params)
-                total = cur.fetchone()[0]
-
-                # Determine sort column
-                sort_col = "started_at"
-                if sort_by:
-                    if sort_by.startswith("record."):
-                        sort_col = sort_by.split(".", 1)[1]
-                    elif sort_by.startswith("params."):
-                        key = sort_by.split(".", 1)[1]
-                        sort_col = f"(record_json->'params_resolved'->>'{key}')"
-                    elif sort_by.startswith("metrics."):
-                        key = sort_by.split(".", 1)[1]
-                        sort_col = f"(record_json->'metrics'->>'{key}')::float"
-
+                count_params: list[Any] = params
+                total: int | None = None
+                count_key: tuple | None = None
+                if count_mode == "cached":
+                    count_key = (tuple(scope.schemas), where_sql, tuple(params))
+                    total = self._get_cached_count(count_key)
+                    if total is not None:
+                        count_key = None  # fresh hit: keep its timestamp
+                elif count_mode == "estimate" and not where_clauses:
+                    count_sql = _ESTIMATE_COUNT_SQL
+                    count_params = [[f"{schema}.runs" for schema in scope.schemas]]
+
+                sort_col, is_json_sort = _resolve_sort(sort_by)
                 sort_dir = "DESC" if sort_order == "desc" else "ASC"
 
+                if self._auto_sort_index:
+                    indexes = [_EXPERIMENT_STARTED_INDEX]
+                    if is_json_sort:
+                        indexes.append(_sort_index(sort_col))
+                    self._ensure_indexes(scope, indexes)
+
+                # Keyset condition applies to the page, not the total
+                page_where_sql = where_sql
+                page_params = list(params)
+                if after is not None:
+                    keyset_sql, keyset_params = _keyset_clause(
+                        sort_col, sort_dir, *after
+                    )
+                    page_where_sql = f"{where_sql} AND {keyset_sql}"
+                    page_params.extend(keyset_params)
+                    offset = 0
+
                 # Query with pagination and LEFT JOIN for derived metrics.
                 # Use column projection instead of fetching full record_json
                 # blobs — avoids TOAST decompression of artifacts and other
@@ -512,21 +1059,125 @@ class PostgresStoreAdapter:
                         r.record_json->'provenance' AS provenance,
                         r.record_json->'warnings' AS warnings,
                         r.record_json->'notes' AS notes,
-                        d.derived_json
+                        d.derived_json,
+                        {sort_col} AS sort_key
                     FROM {runs_table}
                     LEFT JOIN {derived_table} ON r.run_id = d.run_id
-                    WHERE {where_sql}
+                    WHERE {page_where_sql}
                     ORDER BY {sort_col} {sort_dir}, r.run_id {sort_dir}
                     LIMIT %s OFFSET %s
                 """
-                params.extend([limit, offset])
 
-                cur.execute(query_sql, params)
-                rows = cur.fetchall()
+                # Count and page are independent: send both in one round trip
+                with _pipeline(conn):
+                    if total is None:
+                        count_cur.execute(count_sql, count_params, prepare=True)
+                    # limit=0 asks for the total only
+                    if limit > 0:
+                        cur.execute(
+                            query_sql, [*page_params, limit, offset], prepare=True
+                        )
+                # The row factory yields RunResponse objects as psycopg loads
+                # each row, without an intermediate list of wide tuples
+                runs: list[RunResponse] = list(cur) if limit > 0 else []
+
+                if total is None:
+                    total = count_cur.fetchone()[0]
+                    if total is None:
+                        # Never-analyzed table: no estimate available
+                        count_cur.execute(
+                            f"SELECT COUNT(*) FROM {runs_table}", []
+                        )
+                        total = count_cur.fetchone()[0]
+
+                if count_key is not None:
+                    self._set_cached_count(count_key, total)
+
+                next_cursor = None
+                if last_row and len(runs) == limit:
+                    next_cursor = _encode_run_cursor(
+                        sort_by, sort_order, last_row[0][-1], last_row[0][0]
+                    )
+
+                return runs, total, next_cursor
+
+    def _run_row_factory(self, last_row: list[Any]) -> Any:
+        """
+        psycopg row factory turning runs-page rows into RunResponse.
+
+        Each row is converted as it is loaded. The raw values of the latest
+        row are kept as last_row[0]; its trailing sort_key column feeds
+        next_cursor.
+        """
+
+        def factory(cursor: Any) -> Any:
+            def make_run(values: Any) -> RunResponse:
+                last_row[:] = (values,)
+                return self._slim_row_to_run_response(values)
+
+            return make_run
+
+        return factory
+
+    def _ensure_indexes(self, scope: SchemaScope, indexes: list[tuple[str, str]]) -> None:
+        """
+        Create (name, definition) indexes on each schema's runs table, once.
 
-                runs = [self._slim_row_to_run_response(row) for row in rows]
+        CREATE INDEX CONCURRENTLY runs on its own autocommit connection in
+        a background thread; this request is not delayed and pool
+        connections are not held.
+        """
+        statements = []
+        for schema in scope.schemas:
+            for name, definition in indexes:
+                if (schema, name) in self._created_indexes:
+                    continue
+                self._created_indexes.add((schema, name))
+                statements.append(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {schema}.runs {definition}"
+                )
+        if statements:
+            threading.Thread(
+                target=self._create_indexes,
+                args=(statements,),
+                name="atlas-index",
+                daemon=True,
+            ).start()
+
+    def _create_indexes(self, statements: list[str]) -> None:
+        """Run CREATE INDEX CONCURRENTLY statements outside a transaction."""
+        import psycopg  # type: ignore[import-not-found]
 
-                return runs, total
+        try:
+            with psycopg.connect(self._connection_string, autocommit=True) as conn:
+                for statement in statements:
+                    logger.info(f"Creating index: {statement}")
+                    conn.execute(statement)
+        except Exception as e:
+            logger.warning(f"Could not create index: {e}")
+
+    def _get_cached_count(self, key: tuple) -> int | None:
+        """Return a cached query_runs total if still within the TTL."""
+        try:
+            entry = self._count_cache.get(key)
+        except TypeError:  # unhashable filter value
+            return None
+        if entry is None:
+            return None
+        cached_time, total = entry
+        if (datetime.now(timezone.utc) - cached_time).total_seconds() >= self._cache_ttl:
+            return None
+        return total
+
+    def _set_cached_count(self, key: tuple, total: int) -> None:
+        """Remember a query_runs total; the cache is bounded by clearing."""
+        if len(self._count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+            self._count_cache.clear()
+        try:
+            self._count_cache[key] = (datetime.now(timezone.utc), total)
+        except TypeError:  # unhashable filter value
+            pass
 
     # Record fields that exist as table columns (same as metalab postgres runs table).
     # Other record fields (tags, warnings, notes, error, provenance) live only in record_json.
@@ -545,7 +1196,13 @@ class PostgresStoreAdapter:
     )
 
     def _build_field_filter(self, ff: Any) -> tuple[str, list[Any]]:
-        """Build SQL clause for a field filter."""
+        """
+        Build SQL clause for a field filter.
+
+        Raises:
+            ValueError: If a params/metrics key does not match _SORT_KEY_RE
+                (those keys are interpolated into the SQL).
+        """
         field_path = ff.field
         op = ff.op.value
         value = ff.value
@@ -556,93 +1213,53 @@ class PostgresStoreAdapter:
             return "", []
 
         namespace, key = parts
+        if namespace in ("params", "metrics") and not _SORT_KEY_RE.fullmatch(key):
+            raise ValueError(f"Cannot filter by {field_path}")
 
-        # Map to JSONB path
+        # Pick the SQL expression and the operator table for its namespace
         if namespace == "record":
             if key in self._RECORD_TABLE_COLUMNS:
-                col = key
-                if op == "eq":
-                    return f"{col} = %s", [value]
-                elif op == "ne":
-                    return f"{col} != %s", [value]
-                elif op == "lt":
-                    return f"{col} < %s", [value]
-                elif op == "le":
-                    return f"{col} <= %s", [value]
-                elif op == "gt":
-                    return f"{col} > %s", [value]
-                elif op == "ge":
-                    return f"{col} >= %s", [value]
-                elif op == "contains":
-                    return f"{col}::text ILIKE %s", [f"%{value}%"]
-                elif op == "in":
-                    placeholders = ", ".join(["%s"] * len(value))
-                    return f"{col} IN ({placeholders})", list(value)
+                path, ops = key, _COLUMN_OPS
             else:
                 # Field lives in record_json (e.g. tags, warnings, notes, error, provenance)
                 # Return full expression with r. so caller does not prepend again
-                jsonb_path = "(r.record_json->'" + key.replace("'", "''") + "')::text"
-                if op == "eq":
-                    return f"{jsonb_path} = %s", [str(value)]
-                elif op == "ne":
-                    return f"{jsonb_path} != %s", [str(value)]
-                elif op == "contains":
-                    return f"{jsonb_path} ILIKE %s", [f"%{value}%"]
-                elif op == "in":
-                    placeholders = ", ".join(["%s"] * len(value))
-                    return f"{jsonb_path} IN ({placeholders})", [str(v) for v in value]
-                # lt/le/gt/ge not meaningful for JSONB tags/warnings
-                return "", []
+                path = "(r.record_json->'" + key.replace("'", "''") + "')::text"
+                ops = _RECORD_JSON_OPS
         elif namespace == "params":
-            jsonb_path = f"record_json->'params_resolved'->>'{key}'"
+            path = f"record_json->'params_resolved'->>'{key}'"
+            ops = _JSONB_NUMERIC_OPS if isinstance(value, (int, float)) else _JSONB_OPS
         elif namespace == "metrics":
-            jsonb_path = f"record_json->'metrics'->>'{key}'"
-        elif namespace == "derived":
-            # Derived metrics are in a separate table
-            return "", []  # TODO: Join with derived table
+            path = f"record_json->'metrics'->>'{key}'"
+            ops = _JSONB_NUMERIC_OPS if isinstance(value, (int, float)) else _JSONB_OPS
         else:
+            # derived.* lives in a separate table (TODO: join with derived table)
             return "", []
 
-        # JSONB comparison
-        if op == "eq":
-            if isinstance(value, (int, float)):
-                # Use numeric cast to avoid int/float text mismatch
-                # (e.g., JSON -80 extracts as '-80' but str(-80.0) == '-80.0')
-                return f"({jsonb_path})::numeric = %s", [value]
-            return f"{jsonb_path} = %s", [str(value)]
-        elif op == "ne":
-            if isinstance(value, (int, float)):
-                return f"({jsonb_path})::numeric != %s", [value]
-            return f"{jsonb_path} != %s", [str(value)]
-        elif op == "lt":
-            return f"({jsonb_path})::float < %s", [float(value)]
-        elif op == "le":
-            return f"({jsonb_path})::float <= %s", [float(value)]
-        elif op == "gt":
-            return f"({jsonb_path})::float > %s", [float(value)]
-        elif op == "ge":
-            return f"({jsonb_path})::float >= %s", [float(value)]
-        elif op == "contains":
-            return f"{jsonb_path} ILIKE %s", [f"%{value}%"]
-        elif op == "in":
-            placeholders = ", ".join(["%s"] * len(value))
-            return f"{jsonb_path} IN ({placeholders})", [str(v) for v in value]
-
-        return "", []
+        entry = ops.get(op)
+        if entry is None:
+            return "", []
+        template, transform = entry
+        if op == "in":
+            values = [transform(v) for v in value]
+            return template.format(p=path, values=_in_placeholders(len(values))), values
+        return template.format(p=path), [transform(value)]
 
     def _row_to_run_response(
-        self, row: tuple, derived_json: dict | None = None
+        self,
+        row: tuple,
+        derived_json: dict | None = None,
+        artifacts: list[dict] | None = None,
     ) -> RunResponse:
         """Convert a database row to RunResponse.
 
         Args:
             row: Tuple of (run_id, record_json)
             derived_json: Optional derived metrics dict (from derived table)
+            artifacts: Artifact dicts with private metadata keys already
+                removed (see _ARTIFACTS_SQL); read from record_json if None
         """
-        run_id, record_json = row
-
-        # record_json is the full serialized RunRecord
-        data = record_json if isinstance(record_json, dict) else json.loads(record_json)
+        # record_json (data) is the full serialized RunRecord
+        run_id, data = row
 
         # Build provenance
         prov_data = data.get("provenance", {})
@@ -656,7 +1273,19 @@ class PostgresStoreAdapter:
         )
 
         # Build artifacts
-        artifacts = [
+        if artifacts is None:
+            artifacts = [
+                {
+                    **a,
+                    "metadata": {
+                        k: v
+                        for k, v in a.get("metadata", {}).items()
+                        if not k.startswith("_")
+                    },
+                }
+                for a in data.get("artifacts", [])
+            ]
+        artifact_infos = [
             ArtifactInfo(
                 artifact_id=a.get("artifact_id", ""),
                 name=a.get("name", ""),
@@ -664,13 +1293,9 @@ class PostgresStoreAdapter:
                 format=a.get("format", ""),
                 content_hash=a.get("content_hash"),
                 size_bytes=a.get("size_bytes"),
-                metadata={
-                    k: v
-                    for k, v in a.get("metadata", {}).items()
-                    if not k.startswith("_")
-                },
+                metadata=a.get("metadata") or {},
             )
-            for a in data.get("artifacts", [])
+            for a in artifacts
         ]
 
         # Parse timestamps
@@ -710,21 +1335,22 @@ class PostgresStoreAdapter:
             params=data.get("params_resolved", {}),
             metrics=data.get("metrics", {}),
             derived_metrics=derived_json or {},
-            artifacts=artifacts,
+            artifacts=artifact_infos,
         )
 
     def _slim_row_to_run_response(self, row: tuple) -> RunResponse:
         """Convert a projected (slim) database row to RunResponse.
 
-        Used by query_runs() to avoid fetching full record_json blobs.
+        Used by query_runs_page() to avoid fetching full record_json blobs.
         The SELECT projects individual columns and JSONB sub-paths instead
         of the entire record_json, skipping artifacts and other large fields.
 
-        Column order must match the SELECT in query_runs():
+        Column order must match the SELECT in query_runs_page():
             run_id, experiment_id, status, started_at, finished_at,
             duration_ms, context_fingerprint, params_fingerprint,
             seed_fingerprint, params, metrics, tags, error, provenance,
             warnings, notes, derived_json
+        The trailing keyset sort key column is ignored.
         """
         (
             run_id,
@@ -744,57 +1370,40 @@ class PostgresStoreAdapter:
             warnings_json,
             notes_json,
             derived_json,
+            *_,
         ) = row
 
-        # Parse JSONB sub-paths (psycopg returns dicts for jsonb columns)
-        def _ensure_dict(val: Any) -> dict:
-            if val is None:
-                return {}
-            if isinstance(val, dict):
-                return val
-            return json.loads(val)
-
-        def _ensure_list(val: Any) -> list:
-            if val is None:
-                return []
-            if isinstance(val, list):
-                return val
-            return json.loads(val)
-
-        params = _ensure_dict(params_json)
-        metrics = _ensure_dict(metrics_json)
-        tags = _ensure_list(tags_json)
-        error = error_json if isinstance(error_json, dict) else (
-            json.loads(error_json) if error_json else None
-        )
-        prov_data = _ensure_dict(provenance_json)
-        warnings = _ensure_list(warnings_json)
+        # JSONB sub-paths arrive already decoded (see _configure_connection);
+        # SQL NULL / missing keys come back as None
+        params = params_json or {}
+        metrics = metrics_json or {}
+        tags = tags_json or []
+        error = error_json or None
+        prov_data = provenance_json or {}
+        warnings = warnings_json or []
         notes = notes_json if isinstance(notes_json, str) else (
             str(notes_json) if notes_json is not None else None
         )
-        derived_dict = _ensure_dict(derived_json)
+        derived_dict = derived_json or {}
 
-        # Parse timestamps
-        if isinstance(started_at, str):
-            started_at = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
-        elif started_at is None:
-            started_at = datetime.fromtimestamp(0, tz=timezone.utc)
-
-        if isinstance(finished_at, str):
-            finished_at = datetime.fromisoformat(finished_at.replace("Z", "+00:00"))
+        # Timestamps are timestamptz columns, already decoded to datetime
+        if started_at is None:
+            started_at = _EPOCH
 
         is_running = status == "running"
 
-        provenance = ProvenanceInfo(
+        # Values come typed from Postgres (see _configure_connection), so the
+        # per-row models are built without re-running pydantic validation
+        provenance = ProvenanceInfo.model_construct(
             code_hash=prov_data.get("code_hash"),
             python_version=prov_data.get("python_version"),
             metalab_version=prov_data.get("metalab_version"),
             executor_id=prov_data.get("executor_id"),
             host=prov_data.get("host"),
-            extra=prov_data.get("extra", {}),
+            extra=prov_data.get("extra") or {},
         )
 
-        record = RecordFields(
+        record = RecordFields.model_construct(
             run_id=run_id,
             experiment_id=experiment_id or "",
             status=RunStatus(status),
@@ -811,7 +1420,7 @@ class PostgresStoreAdapter:
             notes=notes,
         )
 
-        return RunResponse(
+        return RunResponse.model_construct(
             record=record,
             params=params,
             metrics=metrics,
@@ -819,53 +1428,63 @@ class PostgresStoreAdapter:
             artifacts=[],  # List queries skip artifacts; use get_run() for full detail
         )
 
-    def get_run(self, run_id: str) -> RunResponse | None:
-        """Get a single run by ID, searching across all schemas."""
+    def get_run(self, run_id: str, *, include_derived: bool = True) -> RunResponse | None:
+        """
+        Get a single run by ID, searching across all schemas.
+
+        With include_derived=False the derived table is not read and
+        derived_metrics is left empty (for callers that only need the
+        record, e.g. to check the run exists or list its artifacts).
+        """
         scope = self._scope_for_run(run_id)
         if scope.is_empty:
             return None
 
         # We know the schema from _scope_for_run, so query directly
         schema = scope.single_schema()
+        # A correlated primary-key lookup rather than a LEFT JOIN, since
+        # exactly one run row is fetched
+        derived_sql = (
+            f"(SELECT d.derived_json FROM {schema}.derived d WHERE d.run_id = r.run_id)"
+            if include_derived
+            else "NULL"
+        )
         with self._get_conn() as conn:
             with conn.cursor() as cur:
-                # Fetch run with derived metrics
+                # Artifacts come back pre-shaped by _ARTIFACTS_SQL, so they
+                # are dropped from the record blob rather than sent twice
                 cur.execute(
-                    f"""SELECT r.run_id, r.record_json, d.derived_json 
-                        FROM {schema}.runs r 
-                        LEFT JOIN {schema}.derived d ON r.run_id = d.run_id 
+                    f"""SELECT r.run_id, r.record_json - 'artifacts',
+                            {_ARTIFACTS_SQL}, {derived_sql}
+                        FROM {schema}.runs r
                         WHERE r.run_id = %s""",
                     [run_id],
+                    prepare=True,
                 )
                 row = cur.fetchone()
                 if not row:
                     return None
-                run_id, record_json, derived_json = row
-                derived_dict = (
-                    derived_json
-                    if isinstance(derived_json, dict)
-                    else (json.loads(derived_json) if derived_json else None)
+                run_id, record_json, artifacts, derived_json = row
+                return self._row_to_run_response(
+                    (run_id, record_json), derived_json, artifacts
                 )
-                return self._row_to_run_response((run_id, record_json), derived_dict)
 
     def get_field_index(self, filter: FilterSpec | None = None) -> FieldIndex:
         """
         Return field metadata index.
 
-        Uses a TTL cache (60s) to avoid redundant queries from frontend polling.
-        Tries the pre-computed field_catalog table first (fast path).
-        Falls back to JSONB introspection only if the catalog is empty
-        or not yet populated.
+        Uses a stale-while-revalidate cache (60s TTL) to avoid redundant
+        queries from frontend polling. Tries the pre-computed field_catalog
+        table first (fast path). Falls back to JSONB introspection only if
+        the catalog is empty or not yet populated.
         """
         cache_key = filter.experiment_id if filter else None
-        now = datetime.now(timezone.utc)
-
-        # Check TTL cache
-        if cache_key in self._field_index_cache:
-            cached_time, cached_result = self._field_index_cache[cache_key]
-            if (now - cached_time).total_seconds() < self._cache_ttl:
-                return cached_result
+        return self._field_index_cache.get(
+            cache_key, lambda: self._load_field_index(filter)
+        )
 
+    def _load_field_index(self, filter: FilterSpec | None) -> FieldIndex:
+        """Query the field index (uncached; see get_field_index)."""
         with self._get_conn() as conn:
             with conn.cursor() as cur:
                 # Fast path: use pre-computed field_catalog if available
@@ -882,8 +1501,6 @@ class PostgresStoreAdapter:
                 if result is None:
                     result = self._get_field_index_from_jsonb(cur, filter)
 
-                # Cache the result
-                self._field_index_cache[cache_key] = (now, result)
                 return result
 
     def _get_field_index_from_catalog(
@@ -916,58 +1533,68 @@ class PostgresStoreAdapter:
         metrics_fields: dict[str, FieldInfo] = {}
         derived_fields: dict[str, FieldInfo] = {}
         record_fields: dict[str, FieldInfo] = {}
-        run_count = 0
 
-        for schema in schemas:
-            # Check if this schema has field_catalog
-            cur.execute(
-                """
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_schema = %s AND table_name = 'field_catalog'
-                )
-            """,
-                [schema],
-            )
-            if not cur.fetchone()[0]:
-                continue
-
-            cur.execute(
-                f"""
-                SELECT namespace, field_name, field_type, count, values, min_value, max_value
-                FROM {schema}.field_catalog
+        # Which schemas have a field_catalog: one probe for all of them
+        cur.execute(
             """
+            SELECT s FROM unnest(%s::text[]) WITH ORDINALITY AS t(s, ord)
+            WHERE to_regclass(s || '.field_catalog') IS NOT NULL
+            ORDER BY ord
+            """,
+            [schemas],
+        )
+        catalog_schemas = [row[0] for row in cur.fetchall()]
+        if not catalog_schemas:
+            return FieldIndex(
+                version=1,
+                last_scan=datetime.now(),
+                run_count=0,
+                params_fields={},
+                metrics_fields={},
+                derived_fields={},
+                record_fields={},
             )
 
-            for row in cur.fetchall():
-                namespace, field_name, field_type, count, values, min_val, max_val = row
+        # All catalogs in one statement; src keeps schema order so a field
+        # present in several schemas resolves to the last one, as before
+        catalog_sql = " UNION ALL ".join(
+            f"SELECT {src} AS src, namespace, field_name, field_type, count, "
+            f"values, min_value, max_value FROM {schema}.field_catalog"
+            for src, schema in enumerate(catalog_schemas)
+        )
+        cur.execute(f"{catalog_sql} ORDER BY src")
 
-                info = FieldInfo(
-                    type=FieldType(field_type) if field_type else FieldType.UNKNOWN,
-                    count=count or 0,
-                    values=values,
-                    min_value=min_val,
-                    max_value=max_val,
-                )
+        for row in cur.fetchall():
+            _, namespace, field_name, field_type, count, values, min_val, max_val = row
 
-                if namespace == "params":
-                    params_fields[field_name] = info
-                elif namespace == "metrics":
-                    metrics_fields[field_name] = info
-                elif namespace == "derived":
-                    derived_fields[field_name] = info
-                elif namespace == "record":
-                    record_fields[field_name] = info
+            info = FieldInfo(
+                type=FieldType(field_type) if field_type else FieldType.UNKNOWN,
+                count=count or 0,
+                values=values,
+                min_value=min_val,
+                max_value=max_val,
+            )
 
-            # Count runs filtered by experiment_id when specified
-            if experiment_id:
-                cur.execute(
-                    f"SELECT COUNT(*) FROM {schema}.runs WHERE experiment_id = %s",
-                    [experiment_id],
-                )
-            else:
-                cur.execute(f"SELECT COUNT(*) FROM {schema}.runs")
-            run_count += cur.fetchone()[0]
+            if namespace == "params":
+                params_fields[field_name] = info
+            elif namespace == "metrics":
+                metrics_fields[field_name] = info
+            elif namespace == "derived":
+                derived_fields[field_name] = info
+            elif namespace == "record":
+                record_fields[field_name] = info
+
+        # Count runs (filtered by experiment_id when specified) in one query
+        where_clause = "WHERE experiment_id = %s" if experiment_id else ""
+        count_sql = " UNION ALL ".join(
+            f"SELECT COUNT(*) AS n FROM {schema}.runs {where_clause}"
+            for schema in catalog_schemas
+        )
+        cur.execute(
+            f"SELECT COALESCE(SUM(n), 0)::bigint FROM ({count_sql}) AS counts",
+            [experiment_id] * len(catalog_schemas) if experiment_id else [],
+        )
+        run_count = cur.fetchone()[0]
 
         return FieldIndex(
             version=1,
@@ -999,6 +1626,10 @@ class PostgresStoreAdapter:
                 record_fields={},
             )
 
+        if self._auto_sort_index:
+            # The per-schema samples below are "latest 1000 runs of experiment"
+            self._ensure_indexes(scope, [_EXPERIMENT_STARTED_INDEX])
+
         # Build optional WHERE clause for experiment_id filtering within schema
         if experiment_id:
             where_clause = "WHERE experiment_id = %s"
@@ -1007,145 +1638,111 @@ class PostgresStoreAdapter:
             where_clause = ""
             where_params = []
 
-        params_stats: dict[str, dict] = {}
-        metrics_stats: dict[str, dict] = {}
-        derived_stats: dict[str, dict] = {}
-        run_count = 0
-
-        for schema in scope.schemas:
-            # Sample runs from this schema (filtered by experiment_id)
-            cur.execute(
-                f"""
-                SELECT record_json
-                FROM {schema}.runs
-                {where_clause}
-                ORDER BY started_at DESC
-                LIMIT 1000
-            """,
-                where_params,
+        # Sample the 1000 most recent runs (and 1000 derived rows) per schema
+        # and aggregate per-field stats server-side, so only one summary row
+        # per field crosses the wire. src keeps schema order for "first seen".
+        run_samples = []
+        derived_samples = []
+        sample_params: list[Any] = []
+        derived_params: list[Any] = []
+        for src, schema in enumerate(scope.schemas):
+            run_samples.append(
+                f"""(SELECT {src} AS src, started_at,
+                        record_json->'params_resolved' AS params,
+                        record_json->'metrics' AS metrics
+                    FROM {schema}.runs {where_clause}
+                    ORDER BY started_at DESC LIMIT 1000)"""
             )
-
-            for (record_json,) in cur.fetchall():
-                data = (
-                    record_json
-                    if isinstance(record_json, dict)
-                    else json.loads(record_json)
-                )
-
-                # Params
-                for key, value in data.get("params_resolved", {}).items():
-                    if key not in params_stats:
-                        params_stats[key] = self._init_stats(value)
-                    self._update_stats(params_stats[key], value)
-
-                # Metrics
-                for key, value in data.get("metrics", {}).items():
-                    if key not in metrics_stats:
-                        metrics_stats[key] = self._init_stats(value)
-                    self._update_stats(metrics_stats[key], value)
-
-            # Sample derived metrics from derived table (filtered by experiment_id
-            # via JOIN on runs to respect the experiment scope)
+            sample_params.extend(where_params)
             if experiment_id:
-                cur.execute(
-                    f"""
-                    SELECT d.derived_json
-                    FROM {schema}.derived d
-                    JOIN {schema}.runs r ON d.run_id = r.run_id
-                    WHERE r.experiment_id = %s
-                    LIMIT 1000
-                """,
-                    [experiment_id],
+                derived_samples.append(
+                    f"""(SELECT {src} AS src, d.derived_json
+                        FROM {schema}.derived d
+                        JOIN {schema}.runs r ON d.run_id = r.run_id
+                        WHERE r.experiment_id = %s LIMIT 1000)"""
                 )
             else:
-                cur.execute(
-                    f"""
-                    SELECT derived_json
-                    FROM {schema}.derived
-                    LIMIT 1000
-                """
+                derived_samples.append(
+                    f"(SELECT {src} AS src, derived_json FROM {schema}.derived LIMIT 1000)"
                 )
+            derived_params.extend(where_params)
 
-            for (derived_json,) in cur.fetchall():
-                data = (
-                    derived_json
-                    if isinstance(derived_json, dict)
-                    else json.loads(derived_json)
-                )
-                for key, value in data.items():
-                    if key not in derived_stats:
-                        derived_stats[key] = self._init_stats(value)
-                    self._update_stats(derived_stats[key], value)
-
-            cur.execute(
-                f"SELECT COUNT(*) FROM {schema}.runs {where_clause}",
-                where_params,
+        cur.execute(
+            f"""
+            WITH sample AS ({" UNION ALL ".join(run_samples)}),
+            derived_sample AS ({" UNION ALL ".join(derived_samples)}),
+            fields AS (
+                SELECT 'params' AS ns, src, started_at, kv.key, kv.value
+                FROM sample, jsonb_each(sample.params) AS kv
+                WHERE jsonb_typeof(sample.params) = 'object'
+                UNION ALL
+                SELECT 'metrics', src, started_at, kv.key, kv.value
+                FROM sample, jsonb_each(sample.metrics) AS kv
+                WHERE jsonb_typeof(sample.metrics) = 'object'
+                UNION ALL
+                SELECT 'derived', src, NULL, kv.key, kv.value
+                FROM derived_sample, jsonb_each(derived_sample.derived_json) AS kv
+                WHERE jsonb_typeof(derived_sample.derived_json) = 'object'
             )
-            run_count += cur.fetchone()[0]
+            SELECT
+                ns,
+                key,
+                (array_agg(jsonb_typeof(value)
+                    ORDER BY src, started_at DESC NULLS LAST))[1] AS first_type,
+                COUNT(*),
+                MIN((value #>> '{{}}')::float8)
+                    FILTER (WHERE jsonb_typeof(value) = 'number'),
+                MAX((value #>> '{{}}')::float8)
+                    FILTER (WHERE jsonb_typeof(value) = 'number'),
+                (array_agg(DISTINCT
+                    CASE WHEN jsonb_typeof(value) = 'boolean'
+                         THEN initcap(value #>> '{{}}')
+                         ELSE value #>> '{{}}' END)
+                    FILTER (WHERE jsonb_typeof(value) IN ('string', 'boolean'))
+                )[1:100]
+            FROM fields
+            GROUP BY ns, key
+            """,
+            [*sample_params, *derived_params],
+        )
+
+        fields: dict[str, dict[str, FieldInfo]] = {
+            "params": {},
+            "metrics": {},
+            "derived": {},
+        }
+        for ns, key, json_type, count, min_val, max_val, values in cur.fetchall():
+            field_type = _JSON_FIELD_TYPES.get(json_type, FieldType.UNKNOWN)
+            numeric = field_type == FieldType.NUMERIC
+            categorical = field_type in (FieldType.STRING, FieldType.BOOLEAN)
+            fields[ns][key] = FieldInfo(
+                type=field_type,
+                count=count,
+                values=sorted(values) if categorical and values else None,
+                min_value=min_val if numeric else None,
+                max_value=max_val if numeric else None,
+            )
+
+        count_sql = " UNION ALL ".join(
+            f"SELECT COUNT(*) AS n FROM {schema}.runs {where_clause}"
+            for schema in scope.schemas
+        )
+        cur.execute(
+            f"SELECT COALESCE(SUM(n), 0)::bigint FROM ({count_sql}) AS counts",
+            where_params * len(scope.schemas),
+        )
+        run_count = cur.fetchone()[0]
 
         return FieldIndex(
             version=1,
             last_scan=datetime.now(),
             run_count=run_count,
-            params_fields={
-                k: self._stats_to_field_info(v) for k, v in params_stats.items()
-            },
-            metrics_fields={
-                k: self._stats_to_field_info(v) for k, v in metrics_stats.items()
-            },
-            derived_fields={
-                k: self._stats_to_field_info(v) for k, v in derived_stats.items()
-            },
+            params_fields=fields["params"],
+            metrics_fields=fields["metrics"],
+            derived_fields=fields["derived"],
             record_fields={},
         )
 
-    def _init_stats(self, value: Any) -> dict:
-        """Initialize field statistics."""
-        return {
-            "type": self._infer_type(value),
-            "count": 0,
-            "values": set(),
-            "min": None,
-            "max": None,
-        }
-
-    def _infer_type(self, value: Any) -> FieldType:
-        """Infer field type from value."""
-        if isinstance(value, bool):
-            return FieldType.BOOLEAN
-        elif isinstance(value, (int, float)):
-            return FieldType.NUMERIC
-        elif isinstance(value, str):
-            return FieldType.STRING
-        return FieldType.UNKNOWN
-
-    def _update_stats(self, stats: dict, value: Any) -> None:
-        """Update field statistics."""
-        stats["count"] += 1
-
-        if stats["type"] == FieldType.NUMERIC and isinstance(value, (int, float)):
-            if stats["min"] is None or value < stats["min"]:
-                stats["min"] = value
-            if stats["max"] is None or value > stats["max"]:
-                stats["max"] = value
-        elif stats["type"] in (FieldType.STRING, FieldType.BOOLEAN):
-            if len(stats["values"]) < 100:
-                stats["values"].add(str(value))
-
-    def _stats_to_field_info(self, stats: dict) -> FieldInfo:
-        """Convert stats to FieldInfo."""
-        values = None
-        if stats["type"] in (FieldType.STRING, FieldType.BOOLEAN) and stats["values"]:
-            values = sorted(stats["values"])
-
-        return FieldInfo(
-            type=stats["type"],
-            count=stats["count"],
-            values=values,
-            min_value=stats.get("min"),
-            max_value=stats.get("max"),
-        )
-
     # =========================================================================
     # Experiment methods
     # =========================================================================
@@ -1155,16 +1752,13 @@ class PostgresStoreAdapter:
         Return list of (experiment_id, run_count, latest_run).
 
         Discovers all metalab schemas and aggregates experiments across them.
-        Uses a TTL cache (60s) to avoid redundant queries from frontend polling.
+        Uses a stale-while-revalidate cache (60s TTL) to avoid redundant
+        queries from frontend polling.
         """
-        now = datetime.now(timezone.utc)
-
-        # Check TTL cache
-        if self._experiments_cache is not None:
-            cached_time, cached_result = self._experiments_cache
-            if (now - cached_time).total_seconds() < self._cache_ttl:
-                return cached_result
+        return self._experiments_cache.get(None, self._load_experiments)
 
+    def _load_experiments(self) -> list[tuple[str, int, datetime | None]]:
+        """Query the experiments list (uncached; see list_experiments)."""
         scope = self._scope_all()
         if scope.is_empty:
             return []
@@ -1182,11 +1776,7 @@ class PostgresStoreAdapter:
                     ORDER BY latest_run DESC NULLS LAST
                 """
                 )
-                result = [(row[0], row[1], row[2]) for row in cur.fetchall()]
-
-        # Cache the result
-        self._experiments_cache = (now, result)
-        return result
+                return [(row[0], row[1], row[2]) for row in cur.fetchall()]
 
     def get_status_counts(self, experiment_id: str | None = None) -> StatusCounts:
         """Get lightweight status counts across all schemas."""
@@ -1290,8 +1880,7 @@ class PostgresStoreAdapter:
                         summaries[exp_id].name = name
                         summaries[exp_id].total_runs = total_runs
                         if tags_json:
-                            tags = tags_json if isinstance(tags_json, list) else json.loads(tags_json)
-                            summaries[exp_id].tags = tags
+                            summaries[exp_id].tags = tags_json
 
                 # Return in same order as experiment_rows
                 return [summaries[row[0]] for row in experiment_rows if row[0] in summaries]
@@ -1371,7 +1960,7 @@ class PostgresStoreAdapter:
                 if row is None:
                     return None
 
-                data = row[0] if isinstance(row[0], dict) else json.loads(row[0])
+                data = row[0]
 
                 operation_data = data.get("operation", {})
                 operation = (
@@ -1428,11 +2017,13 @@ class PostgresStoreAdapter:
         self,
         run_id: str,
         artifact_name: str,
-    ) -> tuple[str, str, int] | None:
+    ) -> tuple[str, str, str, int] | None:
         """
         Get artifact metadata from run record.
 
-        Returns (uri, format, size_bytes) or None if not found.
+        Returns (schema, uri, format, size_bytes) or None if not found; the
+        schema is the run's, for reading pgblob content without another
+        lookup.
         """
         scope = self._scope_for_run(run_id)
         schema = scope.single_schema()
@@ -1441,24 +2032,22 @@ class PostgresStoreAdapter:
 
         with self._get_conn() as conn:
             with conn.cursor() as cur:
-                # Get artifacts from the run record JSON
+                # Match the artifact by name in SQL; only its three fields
+                # are sent back, not the run's whole artifacts array
                 cur.execute(
-                    f"SELECT record_json->'artifacts' FROM {schema}.runs WHERE run_id = %s",
-                    [run_id],
+                    f"""SELECT COALESCE(a->>'uri', ''), COALESCE(a->>'format', ''),
+                            COALESCE((a->>'size_bytes')::numeric::bigint, 0)
+                        FROM {schema}.runs r,
+                            jsonb_array_elements(CASE
+                                WHEN jsonb_typeof(r.record_json->'artifacts') = 'array'
+                                THEN r.record_json->'artifacts' END) a
+                        WHERE r.run_id = %s AND a->>'name' = %s
+                        LIMIT 1""",
+                    [run_id, artifact_name],
+                    prepare=True,
                 )
                 row = cur.fetchone()
-                if not row or not row[0]:
-                    return None
-
-                artifacts = row[0]
-                for artifact in artifacts:
-                    if artifact.get("name") == artifact_name:
-                        uri = artifact.get("uri", "")
-                        fmt = artifact.get("format", "")
-                        size = artifact.get("size_bytes", 0)
-                        return uri, fmt, size
-
-        return None
+                return (schema, row[0], row[1], row[2]) if row else None
 
     def _get_blob_content(self, artifact_id: str, schema: str) -> bytes | None:
         """Get artifact content from pgblob storage."""
@@ -1470,10 +2059,12 @@ class PostgresStoreAdapter:
                     WHERE artifact_id = %s
                 """,
                     [artifact_id],
+                    prepare=True,
                 )
                 row = cur.fetchone()
                 if row:
-                    return bytes(row[0])
+                    # bytea already loads as bytes; no defensive copy
+                    return row[0]
         return None
 
     def _resolve_artifact_path(
@@ -1487,9 +2078,9 @@ class PostgresStoreAdapter:
             return path if path.exists() else None
 
         # Relative path: {file_root}/{safe_exp_id}/{uri}
-        if self._file_root and experiment_id:
+        if self._file_root_path and experiment_id:
             safe_id = safe_experiment_id(experiment_id)
-            resolved = Path(self._file_root) / safe_id / uri
+            resolved = self._file_root_path / safe_id / uri
             return resolved if resolved.exists() else None
 
         return None
@@ -1511,7 +2102,7 @@ class PostgresStoreAdapter:
         if not info:
             raise FileNotFoundError(f"Artifact not found: {run_id}/{artifact_name}")
 
-        uri, format_, size_bytes = info
+        schema, uri, format_, size_bytes = info
         content_type = (
             mimetypes.guess_type(f"file.{format_}")[0] or "application/octet-stream"
         )
@@ -1519,12 +2110,9 @@ class PostgresStoreAdapter:
         if uri.startswith("pgblob://"):
             # Inline blob in database
             artifact_id = uri.replace("pgblob://", "")
-            scope = self._scope_for_run(run_id)
-            schema = scope.single_schema()
-            if schema:
-                content = self._get_blob_content(artifact_id, schema)
-                if content:
-                    return content, content_type
+            content = self._get_blob_content(artifact_id, schema)
+            if content:
+                return content, content_type
         else:
             # Filesystem path - requires file_root
             if not self._file_root:
@@ -1556,16 +2144,13 @@ class PostgresStoreAdapter:
         if not info:
             raise FileNotFoundError(f"Artifact not found: {run_id}/{artifact_name}")
 
-        uri, artifact_format, size_bytes = info
+        schema, uri, artifact_format, size_bytes = info
         content: bytes | None = None
 
         if uri.startswith("pgblob://"):
             # Inline blob in database
             artifact_id = uri.replace("pgblob://", "")
-            scope = self._scope_for_run(run_id)
-            schema = scope.single_schema()
-            if schema:
-                content = self._get_blob_content(artifact_id, schema)
+            content = self._get_blob_content(artifact_id, schema)
         elif self._file_root:
             # Filesystem path - only attempt if file_root is configured
             experiment_id = self._get_experiment_id_for_run(run_id)
@@ -1599,20 +2184,48 @@ class PostgresStoreAdapter:
                 pass
         elif artifact_format == "npz":
             try:
-                import numpy as np
+                import zipfile
+
+                from numpy.lib import format as npy_format
 
                 from atlas.models import ArrayInfo, NumpyInfo
 
-                with np.load(io.BytesIO(content), allow_pickle=False) as data:
+                # Shape and dtype come from each member's .npy header; only
+                # small 1-D arrays (whose values are returned) are decoded.
+                # Other header versions (e.g. 3.0, utf-8) go through
+                # read_array, which decodes them correctly
+                header_readers = {
+                    (1, 0): npy_format.read_array_header_1_0,
+                    (2, 0): npy_format.read_array_header_2_0,
+                }
+                with zipfile.ZipFile(io.BytesIO(content)) as npz:
                     arrays = {}
-                    for name in data.files:
-                        arr = data[name]
-                        values = None
-                        if len(arr.shape) == 1 and arr.shape[0] <= 10000:
-                            values = arr.astype(float).tolist()
-                        arrays[name] = ArrayInfo(
-                            shape=list(arr.shape),
-                            dtype=str(arr.dtype),
+                    for member in npz.namelist():
+                        try:
+                            arr = None
+                            with npz.open(member) as f:
+                                version = npy_format.read_magic(f)
+                                read_header = header_readers.get(version)
+                                if read_header is not None:
+                                    shape, _, dtype = read_header(f)
+                            if read_header is None:
+                                with npz.open(member) as f:
+                                    arr = npy_format.read_array(f, allow_pickle=False)
+                                shape, dtype = arr.shape, arr.dtype
+                            values = None
+                            if len(shape) == 1 and shape[0] <= 10000:
+                                if arr is None:
+                                    with npz.open(member) as f:
+                                        arr = npy_format.read_array(
+                                            f, allow_pickle=False
+                                        )
+                                values = arr.astype(float).tolist()
+                        except Exception:
+                            # Skip an unreadable member, keep the others
+                            continue
+                        arrays[member.removesuffix(".npy")] = ArrayInfo(
+                            shape=list(shape),
+                            dtype=str(dtype),
                             values=values,
                         )
                     preview.numpy_info = NumpyInfo(arrays=arrays)
@@ -1651,10 +2264,10 @@ class PostgresStoreAdapter:
         Logs are stored on the filesystem via FileStore composition.
         Path: {file_root}/{safe_exp_id}/logs/{run_id}_{log_name}.log
         """
-        if not self._file_root:
+        exp_root = self._file_root_path
+        if exp_root is None:
             return None
 
-        exp_root = Path(self._file_root)
         experiment_id = self._get_experiment_id_for_run(run_id)
         if not experiment_id:
             return None
@@ -1674,22 +2287,26 @@ class PostgresStoreAdapter:
         """
         log_names: set[str] = set()
 
-        if not self._file_root:
+        exp_root = self._file_root_path
+        if exp_root is None:
             return []
 
-        exp_root = Path(self._file_root)
         experiment_id = self._get_experiment_id_for_run(run_id)
         if not experiment_id:
             return []
 
         safe_id = safe_experiment_id(experiment_id)
         log_dir = exp_root / safe_id / "logs"
-        if log_dir.exists():
-            for log_file in log_dir.glob(f"{run_id}_*.log"):
-                filename = log_file.stem  # Remove .log
-                if filename.startswith(f"{run_id}_"):
-                    name = filename[len(run_id) + 1 :]
-                    log_names.add(name)
+        # One scandir pass on plain names; no Path objects or glob matching
+        prefix = f"{run_id}_"
+        try:
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if filename.startswith(prefix) and filename.endswith(".log"):
+                        log_names.add(filename[len(prefix) : -len(".log")])
+        except FileNotFoundError:
+            pass
 
         return sorted(log_names)
 
@@ -1725,24 +2342,17 @@ class PostgresStoreAdapter:
                     WHERE run_id = %s AND name = %s
                 """,
                     [run_id, name],
+                    prepare=True,
                 )
                 row = cur.fetchone()
                 if row is None:
                     return None
 
                 return {
-                    "data": (
-                        row[0]
-                        if isinstance(row[0], (dict, list))
-                        else json.loads(row[0])
-                    ),
+                    "data": row[0],
                     "dtype": row[1],
                     "shape": list(row[2]) if row[2] else None,
-                    "metadata": (
-                        row[3]
-                        if isinstance(row[3], dict)
-                        else json.loads(row[3] or "{}")
-                    ),
+                    "metadata": row[3] or {},
                 }
 
     def list_results(self, run_id: str) -> list[str]:
@@ -1847,15 +2457,6 @@ class PostgresStoreAdapter:
 
                 where_sql = " AND ".join(where_clauses)
 
-                # Get total count
-                cur.execute(
-                    f"SELECT COUNT(*) FROM {from_clause} WHERE {where_sql}", params
-                )
-                total = cur.fetchone()[0]
-
-                # Determine if sampling is needed
-                sampled = total > request.max_points
-
                 # Build field accessors
                 field_accessors = []
                 for field in request.fields:
@@ -1870,8 +2471,56 @@ class PostgresStoreAdapter:
                         else f"run_id, {select_fields}"
                     )
 
-                # Build query with optional sampling
-                if sampled:
+                # Parse results
+                fields_data: dict[str, list[float | str | None]] = {
+                    f: [] for f in request.fields
+                }
+                run_ids: list[str] = []
+                returned = 0
+
+                def collect(batch: list[tuple]) -> None:
+                    # Batches are transposed into columns by zip (C) rather
+                    # than per value
+                    nonlocal returned
+                    returned += len(batch)
+                    columns = zip(*batch)
+                    if request.include_run_ids:
+                        run_ids.extend(next(columns))
+                    for field, column in zip(request.fields, columns):
+                        fields_data[field].extend(column)
+
+                # Rows stream from a server-side cursor in batches, so the
+                # result set is never held twice in client memory. Asking
+                # for one row more than max_points answers the common case
+                # in one round trip: if it fits, its length is the total.
+                # Only an overflow pays for a COUNT(*) and a sample.
+                with conn.cursor(name="atlas_field_values") as data_cur:
+                    data_cur.execute(
+                        f"""
+                        SELECT {select_fields}
+                        FROM {from_clause}
+                        WHERE {where_sql}
+                        LIMIT %s
+                    """,
+                        params + [request.max_points + 1],
+                    )
+                    while batch := data_cur.fetchmany(10_000):
+                        collect(batch)
+
+                sampled = returned > request.max_points
+                if not sampled:
+                    total = returned
+                else:
+                    # Overflow: drop the unsampled rows, count, then sample
+                    for values in fields_data.values():
+                        values.clear()
+                    run_ids.clear()
+                    returned = 0
+                    cur.execute(
+                        f"SELECT COUNT(*) FROM {from_clause} WHERE {where_sql}", params
+                    )
+                    total = cur.fetchone()[0]
+
                     # Use seed for reproducible sampling (default to 42)
                     seed = request.seed if request.seed is not None else 42
                     # PostgreSQL setseed takes a value between -1 and 1
@@ -1892,7 +2541,6 @@ class PostgresStoreAdapter:
                             WHERE {where_sql}
                             LIMIT %s
                         """
-                        cur.execute(sql, params + [request.max_points])
                     else:
                         # For multi-schema or derived joins, use seeded random() via setseed above
                         sql = f"""
@@ -1902,38 +2550,16 @@ class PostgresStoreAdapter:
                             ORDER BY random()
                             LIMIT %s
                         """
-                        cur.execute(sql, params + [request.max_points])
-                else:
-                    sql = f"""
-                        SELECT {select_fields}
-                        FROM {from_clause}
-                        WHERE {where_sql}
-                    """
-                    cur.execute(sql, params)
-
-                rows = cur.fetchall()
-
-                # Parse results
-                fields_data: dict[str, list[float | str | None]] = {
-                    f: [] for f in request.fields
-                }
-                run_ids: list[str] = []
-
-                for row in rows:
-                    if request.include_run_ids:
-                        run_ids.append(row[0])
-                        values = row[1:]
-                    else:
-                        values = row
-
-                    for i, field in enumerate(request.fields):
-                        fields_data[field].append(values[i])
+                    with conn.cursor(name="atlas_field_values") as data_cur:
+                        data_cur.execute(sql, params + [request.max_points])
+                        while batch := data_cur.fetchmany(10_000):
+                            collect(batch)
 
                 return FieldValuesResponse(
                     fields=fields_data,
                     run_ids=run_ids if request.include_run_ids else None,
                     total=total,
-                    returned=len(rows),
+                    returned=returned,
                     sampled=sampled,
                 )
 
@@ -1979,7 +2605,8 @@ class PostgresStoreAdapter:
         SQL-native search across experiments, runs, fields, and fingerprints.
 
         Replaces the generic Python-loop search with ~5 targeted SQL queries,
-        each using appropriate indexes (trigram, GIN, btree).
+        each using appropriate indexes (trigram, GIN, btree). Hits are built
+        with model_construct() since the row values are already typed.
 
         Args:
             q: Search query string.
@@ -2023,14 +2650,14 @@ class PostgresStoreAdapter:
                 total += 1
                 if len(hits) < limit:
                     hits.append(
-                        SearchHit(
+                        SearchHit.model_construct(
                             label=exp_id,
                             sublabel=f"{run_count} runs",
                             entity_type="experiment",
                             entity_id=exp_id,
                         )
                     )
-        return SearchGroup(
+        return SearchGroup.model_construct(
             category="experiments",
             label="Experiments",
             scope="experiment",
@@ -2044,7 +2671,7 @@ class PostgresStoreAdapter:
         """Search field names in field_catalog via SQL ILIKE."""
         scope = self._scope_all()
         if scope.is_empty:
-            return SearchGroup(
+            return SearchGroup.model_construct(
                 category="field_names",
                 label="Field names",
                 scope="experiment",
@@ -2077,7 +2704,7 @@ class PostgresStoreAdapter:
         total = cur.fetchone()[0]
 
         hits = [
-            SearchHit(
+            SearchHit.model_construct(
                 label=field_name,
                 sublabel=f"{namespace} · {count} runs",
                 entity_type="experiment",
@@ -2087,7 +2714,7 @@ class PostgresStoreAdapter:
             for namespace, field_name, count in rows
         ]
 
-        return SearchGroup(
+        return SearchGroup.model_construct(
             category="field_names",
             label="Field names",
             scope="experiment",
@@ -2099,7 +2726,7 @@ class PostgresStoreAdapter:
         """Search run IDs via SQL ILIKE (uses trigram index if available)."""
         scope = self._scope_all()
         if scope.is_empty:
-            return SearchGroup(
+            return SearchGroup.model_construct(
                 category="runs", label="Runs", scope="run", hits=[], total=0
             )
 
@@ -2127,7 +2754,7 @@ class PostgresStoreAdapter:
         rows = cur.fetchall()
 
         hits = [
-            SearchHit(
+            SearchHit.model_construct(
                 label=run_id,
                 sublabel=experiment_id,
                 entity_type="run",
@@ -2136,7 +2763,7 @@ class PostgresStoreAdapter:
             for run_id, experiment_id in rows
         ]
 
-        return SearchGroup(
+        return SearchGroup.model_construct(
             category="runs",
             label="Runs",
             scope="run",
@@ -2150,7 +2777,7 @@ class PostgresStoreAdapter:
         """Search fingerprints via SQL ILIKE with OR across 3 columns."""
         scope = self._scope_all()
         if scope.is_empty:
-            return SearchGroup(
+            return SearchGroup.model_construct(
                 category="fingerprints",
                 label="Fingerprints",
                 scope="run",
@@ -2176,7 +2803,7 @@ class PostgresStoreAdapter:
         rows = cur.fetchall()
 
         hits = [
-            SearchHit(
+            SearchHit.model_construct(
                 label=run_id,
                 sublabel=experiment_id,
                 entity_type="run",
@@ -2187,7 +2814,7 @@ class PostgresStoreAdapter:
 
         total = len(hits) + 1 if len(hits) >= limit else len(hits)
 
-        return SearchGroup(
+        return SearchGroup.model_construct(
             category="fingerprints",
             label="Fingerprints",
             scope="run",
@@ -2201,7 +2828,7 @@ class PostgresStoreAdapter:
         """Search experiment tags from manifests via SQL."""
         scope = self._scope_all()
         if scope.is_empty:
-            return SearchGroup(
+            return SearchGroup.model_construct(
                 category="tags",
                 label="Tags",
                 scope="experiment",
@@ -2231,7 +2858,7 @@ class PostgresStoreAdapter:
         rows = cur.fetchall()
 
         hits = [
-            SearchHit(
+            SearchHit.model_construct(
                 label=exp_id,
                 sublabel=f"tag: {tag}",
                 entity_type="experiment",
@@ -2242,7 +2869,7 @@ class PostgresStoreAdapter:
 
         total = len(hits) + 1 if len(hits) >= limit else len(hits)
 
-        return SearchGroup(
+        return SearchGroup.model_construct(
             category="tags",
             label="Tags",
             scope="experiment",
@@ -2254,7 +2881,7 @@ class PostgresStoreAdapter:
         """Search run tags via JSONB array containment."""
         scope = self._scope_all()
         if scope.is_empty:
-            return SearchGroup(
+            return SearchGroup.model_construct(
                 category="run_tags",
                 label="Run tags",
                 scope="run",
@@ -2296,7 +2923,7 @@ class PostgresStoreAdapter:
         total = cur.fetchone()[0]
 
         hits = [
-            SearchHit(
+            SearchHit.model_construct(
                 label=run_id,
                 sublabel=experiment_id,
                 entity_type="run",
@@ -2305,7 +2932,7 @@ class PostgresStoreAdapter:
             for run_id, experiment_id in rows
         ]
 
-        return SearchGroup(
+        return SearchGroup.model_construct(
             category="run_tags",
             label="Run tags",
             scope="run",
@@ -2320,7 +2947,10 @@ class PostgresStoreAdapter:
     def refresh(self) -> None:
         """Refresh connection and invalidate caches."""
         self._field_index_cache.clear()
-        self._experiments_cache = None
+        self._experiments_cache.clear()
+        self._count_cache.clear()
+        with self._run_schemas_lock:
+            self._run_schemas.clear()
         self._refresh_schema_cache()
 
     def disconnect(self) -> None:
@@ -2332,4 +2962,4 @@ class PostgresStoreAdapter:
 
 def is_postgres_url(url: str) -> bool:
     """Check if a URL is a PostgreSQL connection string."""
-    return url.startswith("postgresql://") or url.startswith("postgres://")
+    return url.startswith(("postgresql://", "postgres://"))
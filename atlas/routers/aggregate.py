@@ -9,7 +9,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from atlas.aggregate import compute_aggregate
-from atlas.capabilities import SupportsSqlPushdown
+from atlas.capabilities import capabilities_of
 from atlas.deps import StoreAdapter, get_store
 from atlas.models import AggregateRequest, AggregateResponse
 
@@ -17,7 +17,7 @@ router = APIRouter(prefix="/api", tags=["aggregate"])
 
 
 @router.post("/aggregate", response_model=AggregateResponse)
-async def aggregate(
+def aggregate(
     request: AggregateRequest,
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> AggregateResponse:
@@ -43,8 +43,9 @@ async def aggregate(
     ```
     """
     # Use SQL pushdown if available (PostgresStoreAdapter)
-    if isinstance(store, SupportsSqlPushdown):
-        return store.compute_aggregate_sql(request)
+    compute_sql = capabilities_of(store).compute_aggregate_sql
+    if compute_sql is not None:
+        return compute_sql(request)
 
     # Fallback to in-memory aggregation
     runs, _ = store.query_runs(
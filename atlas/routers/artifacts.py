@@ -11,18 +11,26 @@ from fastapi.responses import Response
 
 from atlas.deps import StoreAdapter, get_store
 from atlas.pg_store import ContentUnavailableError
-from atlas.models import ArtifactInfo, ArtifactPreview, DataEntryInfo, DataEntryResponse, DataListResponse
+from atlas.models import (
+    ArtifactInfo,
+    ArtifactPreview,
+    DataEntryInfo,
+    DataEntryResponse,
+    DataListResponse,
+    LogContentResponse,
+    LogListResponse,
+)
 
 router = APIRouter(prefix="/api/runs/{run_id}", tags=["artifacts"])
 
 
 @router.get("/artifacts", response_model=list[ArtifactInfo])
-async def list_artifacts(
+def list_artifacts(
     run_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> list[ArtifactInfo]:
     """List artifacts for a run."""
-    run = store.get_run(run_id)
+    run = store.get_run(run_id, include_derived=False)
     if run is None:
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
     return run.artifacts
@@ -31,7 +39,7 @@ async def list_artifacts(
 # NOTE: Preview route must be defined BEFORE the catch-all artifact route
 # to ensure FastAPI matches /preview suffix correctly
 @router.get("/artifacts/{artifact_name}/preview", response_model=ArtifactPreview)
-async def get_artifact_preview(
+def get_artifact_preview(
     run_id: str,
     artifact_name: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
@@ -55,7 +63,7 @@ async def get_artifact_preview(
 
 
 @router.get("/artifacts/{artifact_name}")
-async def get_artifact(
+def get_artifact(
     run_id: str,
     artifact_name: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
@@ -96,7 +104,7 @@ async def get_artifact(
 
 
 @router.get("/data", response_model=DataListResponse)
-async def list_data(
+def list_data(
     run_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> DataListResponse:
@@ -105,7 +113,7 @@ async def list_data(
 
     Returns names plus shape/dtype metadata for each entry.
     """
-    run = store.get_run(run_id)
+    run = store.get_run(run_id, include_derived=False)
     if run is None:
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
 
@@ -128,7 +136,7 @@ async def list_data(
 
 
 @router.get("/data/{data_name}", response_model=DataEntryResponse)
-async def get_data(
+def get_data(
     run_id: str,
     data_name: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
@@ -138,7 +146,7 @@ async def get_data(
 
     Returns the full data payload plus shape/dtype metadata.
     """
-    run = store.get_run(run_id)
+    run = store.get_run(run_id, include_derived=False)
     if run is None:
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
 
@@ -158,38 +166,35 @@ async def get_data(
     )
 
 
-@router.get("/logs")
-async def list_logs(
+@router.get("/logs", response_model=LogListResponse)
+def list_logs(
     run_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
-) -> dict:
+) -> LogListResponse:
     """
     List available log names for a run.
 
     Returns a list of log names (e.g., ["run", "stdout", "stderr"]).
     """
     log_names = store.list_logs(run_id)
-    return {
-        "run_id": run_id,
-        "logs": log_names,
-    }
+    return LogListResponse(run_id=run_id, logs=log_names)
 
 
-@router.get("/logs/{log_name}")
-async def get_log(
+@router.get("/logs/{log_name}", response_model=LogContentResponse)
+def get_log(
     run_id: str,
     log_name: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
-) -> dict:
+) -> LogContentResponse:
     """
     Get log content (stdout, stderr, etc.).
 
     Returns log content as text. Returns empty content if log doesn't exist.
     """
     content = store.get_log(run_id, log_name)
-    return {
-        "run_id": run_id,
-        "log_name": log_name,
-        "content": content or "",
-        "exists": content is not None,
-    }
+    return LogContentResponse(
+        run_id=run_id,
+        log_name=log_name,
+        content=content or "",
+        exists=content is not None,
+    )
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
 from atlas.deps import StoreAdapter, get_store
 from atlas.models import (
@@ -30,7 +30,7 @@ router = APIRouter(prefix="/api/experiments", tags=["experiments"])
 
 
 @router.get("/{experiment_id}/manifests", response_model=ManifestListResponse)
-async def list_manifests(
+def list_manifests(
     experiment_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> ManifestListResponse:
@@ -44,7 +44,7 @@ async def list_manifests(
 
 
 @router.get("/{experiment_id}/manifests/latest", response_model=ManifestResponse | None)
-async def get_latest_manifest(
+def get_latest_manifest(
     experiment_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> ManifestResponse | None:
@@ -58,7 +58,7 @@ async def get_latest_manifest(
 
 
 @router.get("/{experiment_id}/manifests/{timestamp}", response_model=ManifestResponse)
-async def get_manifest(
+def get_manifest(
     experiment_id: str,
     timestamp: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
@@ -73,7 +73,7 @@ async def get_manifest(
 
 
 @router.get("/{experiment_id}/status-counts", response_model=StatusCounts)
-async def get_status_counts(
+def get_status_counts(
     experiment_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> StatusCounts:
@@ -88,7 +88,7 @@ async def get_status_counts(
 
 
 @router.get("/{experiment_id}/export")
-async def export_experiment(
+def export_experiment(
     experiment_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
     format: str = Query(default="csv", pattern="^(csv|parquet)$"),
@@ -119,8 +119,8 @@ async def export_experiment(
         build_export_metadata,
         collect_captured_data_json,
         dataframe_to_csv_bytes,
-        dataframe_to_parquet_bytes,
-        runs_to_dataframe,
+        iter_parquet_chunks,
+        runs_to_arrow_table,
     )
 
     # Query all runs for this experiment
@@ -144,22 +144,14 @@ async def export_experiment(
             run_ids=[r.record.run_id for r in runs],
         )
 
-    # Convert to DataFrame
-    try:
-        df = runs_to_dataframe(
-            runs=runs,
-            include_params=include_params,
-            include_metrics=include_metrics,
-            include_derived=include_derived,
-            include_record=include_record,
-            include_data=include_data,
-            captured_data_json=captured_data_json,
-        )
-    except ImportError as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Export dependencies not installed: {e}",
-        )
+    flatten_options = dict(
+        include_params=include_params,
+        include_metrics=include_metrics,
+        include_derived=include_derived,
+        include_record=include_record,
+        include_data=include_data,
+        captured_data_json=captured_data_json,
+    )
 
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -170,31 +162,44 @@ async def export_experiment(
         manifest = store.get_experiment_manifest(experiment_id)
         context_fingerprint = manifest.context_fingerprint if manifest else None
 
-        # Build metadata and export
+        # Build metadata and stream the file one row group at a time
         try:
             metadata = build_export_metadata(
                 experiment_id=experiment_id,
                 total_runs=len(runs),
                 context_fingerprint=context_fingerprint,
             )
-            content = dataframe_to_parquet_bytes(df, metadata)
+            chunks = iter_parquet_chunks(runs, metadata, **flatten_options)
         except ImportError as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Parquet export requires pyarrow: {e}",
             )
 
+        # A sync iterator: Starlette advances it in the threadpool, so
+        # the Arrow conversion between chunks doesn't block the event loop
         filename = f"{safe_exp_id}_{timestamp}.parquet"
-        media_type = "application/octet-stream"
-    else:
-        # CSV export
-        content = dataframe_to_csv_bytes(df)
-        filename = f"{safe_exp_id}_{timestamp}.csv"
-        media_type = "text/csv"
+        return StreamingResponse(
+            chunks,
+            media_type="application/octet-stream",
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+            },
+        )
+
+    # CSV export
+    try:
+        table = runs_to_arrow_table(runs, **flatten_options)
+    except ImportError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Export dependencies not installed: {e}",
+        )
+    filename = f"{safe_exp_id}_{timestamp}.csv"
 
     return Response(
-        content=content,
-        media_type=media_type,
+        content=dataframe_to_csv_bytes(table),
+        media_type="text/csv",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
         },
@@ -230,8 +235,8 @@ def _get_experiment_store_path(
         if (now - cached_at).total_seconds() < _CACHE_TTL_SECONDS:
             return cached_path
 
-    # Get file_root from the PG adapter if available
-    file_root = getattr(store, "_file_root", None)
+    # Get file_root from the PG adapter if configured
+    file_root = store.file_root
     if file_root:
         safe_id = safe_experiment_id(experiment_id)
         store_path = Path(file_root) / safe_id
@@ -330,7 +335,7 @@ def _get_latest_manifest_path(store_path: str, experiment_id: str) -> Path | Non
 
 
 @router.get("/{experiment_id}/slurm-status", response_model=SlurmArrayStatusResponse)
-async def get_slurm_status(
+def get_slurm_status(
     experiment_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> SlurmArrayStatusResponse:
@@ -338,7 +343,7 @@ async def get_slurm_status(
     Get SLURM scheduler status for an experiment.
 
     Returns detailed job state counts from squeue (active jobs) and
-    sacct (terminal jobs). For remote stores, executes commands via SSH.
+    sacct (terminal jobs). Commands run locally on the Atlas host.
 
     Args:
         experiment_id: The experiment identifier.
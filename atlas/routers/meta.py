@@ -31,14 +31,16 @@ class RefreshResponse(BaseModel):
 
 
 @router.post("/refresh", response_model=RefreshResponse)
-async def refresh_store_discovery() -> RefreshResponse:
+def refresh_store_discovery(
+    store: Annotated[StoreAdapter, Depends(get_store)],
+) -> RefreshResponse:
     """
     Refresh store discovery to pick up new experiments.
 
     Call this endpoint after adding new experiments to the store directory
     without needing to restart the server.
     """
-    count = refresh_stores()
+    count = refresh_stores(store)
     return RefreshResponse(
         stores_discovered=count,
         message=f"Refreshed {count} store(s)",
@@ -46,7 +48,7 @@ async def refresh_store_discovery() -> RefreshResponse:
 
 
 @router.get("/fields", response_model=FieldIndex)
-async def get_fields(
+def get_fields(
     store: Annotated[StoreAdapter, Depends(get_store)],
     experiment_id: str | None = Query(default=None),
 ) -> FieldIndex:
@@ -70,7 +72,7 @@ async def get_fields(
 
 
 @router.get("/experiments", response_model=ExperimentsResponse)
-async def list_experiments(
+def list_experiments(
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> ExperimentsResponse:
     """
@@ -99,7 +101,7 @@ async def list_experiments(
 
 
 @router.get("/experiments/summary", response_model=ExperimentsSummaryResponse)
-async def list_experiments_summary(
+def list_experiments_summary(
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> ExperimentsSummaryResponse:
     """
@@ -4,10 +4,11 @@ Runs API router: List and get run records.
 
 from __future__ import annotations
 
-import json
+import logging
 from datetime import datetime
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from atlas.deps import StoreAdapter, get_store
@@ -20,6 +21,8 @@ from atlas.models import (
     RunStatus,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/runs", tags=["runs"])
 
 
@@ -41,7 +44,7 @@ def parse_filter_spec(
     parsed_field_filters = None
     if field_filters:
         try:
-            raw_filters = json.loads(field_filters)
+            raw_filters = orjson.loads(field_filters)
             parsed_field_filters = [
                 FieldFilter(
                     field=f["field"],
@@ -50,10 +53,9 @@ def parse_filter_spec(
                 )
                 for f in raw_filters
             ]
-            print(f"[DEBUG] Parsed field_filters: {parsed_field_filters}")
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"[DEBUG] Failed to parse field_filters: {e}, raw: {field_filters}")
-            pass  # Invalid filter format - ignore
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            # Invalid filter format - ignore
+            logger.debug("Ignoring invalid field_filters %r: %s", field_filters, e)
 
     return FilterSpec(
         experiment_id=experiment_id,
@@ -65,13 +67,18 @@ def parse_filter_spec(
 
 
 @router.get("", response_model=RunListResponse)
-async def list_runs(
+def list_runs(
     store: Annotated[StoreAdapter, Depends(get_store)],
     filter: Annotated[FilterSpec, Depends(parse_filter_spec)],
     sort_by: str | None = Query(default="record.started_at"),
     sort_order: str = Query(default="desc", pattern="^(asc|desc)$"),
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None,
+        description="next_cursor from the previous page (keyset pagination; "
+        "offset is ignored when set)",
+    ),
 ) -> RunListResponse:
     """
     List runs with filtering, sorting, and pagination.
@@ -82,25 +89,33 @@ async def list_runs(
     - started_after/started_before: time range
 
     Sorting can be on any field (e.g., record.started_at, metrics.best_f).
+
+    Pages can be fetched by offset, or by passing the previous response's
+    next_cursor, which stays fast on deep pages.
     """
-    runs, total = store.query_runs(
-        filter=filter,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        runs, total, next_cursor = store.query_runs_page(
+            filter=filter,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return RunListResponse(
         runs=runs,
         total=total,
         limit=limit,
-        offset=offset,
+        offset=0 if cursor else offset,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/{run_id}", response_model=RunResponse)
-async def get_run(
+def get_run(
     run_id: str,
     store: Annotated[StoreAdapter, Depends(get_store)],
 ) -> RunResponse:
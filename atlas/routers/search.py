@@ -1,14 +1,20 @@
 """
 Search API router: global search across experiments, runs, fields, artifacts, logs.
+
+Search models are built from store data that already has the declared types,
+so they are created with model_construct() to skip per-hit validation.
 """
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
 
-from atlas.capabilities import SupportsSearch
+from atlas.capabilities import capabilities_of
 from atlas.deps import StoreAdapter, get_store
 from atlas.models import (
     FieldFilter,
@@ -25,6 +31,53 @@ router = APIRouter(prefix="/api/search", tags=["search"])
 LOG_SEARCH_MAX_RUNS = 500
 
 
+# Built once at import so every request reuses the same core serializer
+_SEARCH_RESPONSE_ADAPTER = TypeAdapter(SearchResponse)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _ndjson_lines(response: SearchResponse) -> AsyncIterator[bytes]:
+    """Yield a search response as NDJSON: a header line, then each group and its hits.
+
+    Every line carries a "kind" key ("search", "group" or "hit"); hits follow
+    the group they belong to.
+    """
+    yield orjson.dumps(
+        {"kind": "search", "query": response.query, "truncated": response.truncated}
+    ) + b"\n"
+    for group in response.groups:
+        yield orjson.dumps(
+            {
+                "kind": "group",
+                "category": group.category,
+                "label": group.label,
+                "scope": group.scope,
+                "total": group.total,
+            }
+        ) + b"\n"
+        for hit in group.hits:
+            yield orjson.dumps({"kind": "hit", **hit.model_dump()}) + b"\n"
+
+
+def _json_response(request: Request, response: SearchResponse) -> Response:
+    """Serialize a search response once, bypassing FastAPI's response handling.
+
+    The route keeps response_model=SearchResponse for the OpenAPI schema;
+    returning a Response directly skips re-validating every hit. Clients
+    sending ``Accept: application/x-ndjson`` get the response streamed as
+    one JSON object per line instead.
+    """
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _ndjson_lines(response), media_type=NDJSON_MEDIA_TYPE
+        )
+    return Response(
+        content=_SEARCH_RESPONSE_ADAPTER.dump_json(response),
+        media_type="application/json",
+    )
+
+
 def _matches(q: str, text: str) -> bool:
     """Case-insensitive substring match."""
     if not q or not text:
@@ -45,14 +98,14 @@ def _search_experiments(store: StoreAdapter, q: str, limit: int) -> SearchGroup:
             total += 1
             if len(hits) < limit:
                 hits.append(
-                    SearchHit(
+                    SearchHit.model_construct(
                         label=exp_id,
                         sublabel=f"{run_count} runs",
                         entity_type="experiment",
                         entity_id=exp_id,
                     )
                 )
-    return SearchGroup(
+    return SearchGroup.model_construct(
         category="experiments",
         label="Experiments",
         scope="experiment",
@@ -108,7 +161,7 @@ def _search_field_names_cached(
                 total += 1
                 if len(hits) < limit:
                     hits.append(
-                        SearchHit(
+                        SearchHit.model_construct(
                             label=exp_id,
                             sublabel=f"{field_name} · {run_count} runs",
                             entity_type="experiment",
@@ -116,7 +169,7 @@ def _search_field_names_cached(
                         )
                     )
                 break  # One hit per experiment for this group
-    return SearchGroup(
+    return SearchGroup.model_construct(
         category=category,
         label=group_label,
         scope="experiment",
@@ -152,6 +205,8 @@ def _search_field_values(
     for field_name, info in fields.items():
         if len(hits) >= limit:
             break
+        # Built once per field and shared by the filter and all of its hits
+        field_path = f"{namespace}.{field_name}"
         # Categorical: check values list
         if info.values:
             for v in info.values:
@@ -160,7 +215,7 @@ def _search_field_values(
                         filter=FilterSpec(
                             field_filters=[
                                 FieldFilter(
-                                    field=f"{namespace}.{field_name}",
+                                    field=field_path,
                                     op=FilterOp.CONTAINS,
                                     value=q,
                                 )
@@ -169,16 +224,17 @@ def _search_field_values(
                         limit=limit - len(hits),
                         offset=0,
                     )
+                    sublabel = f"{field_name}={v}"
                     for run in runs:
                         if run.record.run_id not in seen_run_ids:
                             seen_run_ids.add(run.record.run_id)
                             hits.append(
-                                SearchHit(
+                                SearchHit.model_construct(
                                     label=run.record.run_id,
-                                    sublabel=f"{field_name}={v}",
+                                    sublabel=sublabel,
                                     entity_type="run",
                                     entity_id=run.record.run_id,
-                                    field=f"{namespace}.{field_name}",
+                                    field=field_path,
                                     value=v,
                                 )
                             )
@@ -196,7 +252,7 @@ def _search_field_values(
                     filter=FilterSpec(
                         field_filters=[
                             FieldFilter(
-                                field=f"{namespace}.{field_name}",
+                                field=field_path,
                                 op=FilterOp.EQ,
                                 value=q_num,
                             )
@@ -218,12 +274,12 @@ def _search_field_values(
                             )
                         )
                         hits.append(
-                            SearchHit(
+                            SearchHit.model_construct(
                                 label=run.record.run_id,
                                 sublabel=f"{field_name}={val}",
                                 entity_type="run",
                                 entity_id=run.record.run_id,
-                                field=f"{namespace}.{field_name}",
+                                field=field_path,
                                 value=str(val) if val is not None else None,
                             )
                         )
@@ -231,7 +287,7 @@ def _search_field_values(
                             break
 
     # Total count: we don't compute exact total for field values (expensive)
-    return SearchGroup(
+    return SearchGroup.model_construct(
         category=category,
         label=group_label,
         scope="run",
@@ -252,7 +308,7 @@ def _search_run_ids(store: StoreAdapter, q: str, limit: int) -> SearchGroup:
         offset=0,
     )
     hits = [
-        SearchHit(
+        SearchHit.model_construct(
             label=r.record.run_id,
             sublabel=r.record.experiment_id,
             entity_type="run",
@@ -260,7 +316,7 @@ def _search_run_ids(store: StoreAdapter, q: str, limit: int) -> SearchGroup:
         )
         for r in runs
     ]
-    return SearchGroup(
+    return SearchGroup.model_construct(
         category="runs",
         label="Runs",
         scope="run",
@@ -292,7 +348,7 @@ def _search_fingerprints(store: StoreAdapter, q: str, limit: int) -> SearchGroup
                 continue
             seen.add(r.record.run_id)
             hits.append(
-                SearchHit(
+                SearchHit.model_construct(
                     label=r.record.run_id,
                     sublabel=r.record.experiment_id,
                     entity_type="run",
@@ -302,7 +358,7 @@ def _search_fingerprints(store: StoreAdapter, q: str, limit: int) -> SearchGroup
             if len(hits) >= limit:
                 break
     total = len(hits) + 1 if len(hits) >= limit else len(hits)
-    return SearchGroup(
+    return SearchGroup.model_construct(
         category="fingerprints",
         label="Fingerprints",
         scope="run",
@@ -333,7 +389,7 @@ def _search_artifact_names(store: StoreAdapter, q: str, limit: int) -> SearchGro
                 total += 1
                 if len(hits) < limit:
                     hits.append(
-                        SearchHit(
+                        SearchHit.model_construct(
                             label=exp_id,
                             sublabel=f"{art.name} · {run_count} runs",
                             entity_type="experiment",
@@ -341,7 +397,7 @@ def _search_artifact_names(store: StoreAdapter, q: str, limit: int) -> SearchGro
                         )
                     )
                 break
-    return SearchGroup(
+    return SearchGroup.model_construct(
         category="artifacts",
         label="Artifacts",
         scope="experiment",
@@ -368,7 +424,7 @@ def _search_experiment_tags(store: StoreAdapter, q: str, limit: int) -> SearchGr
                 total += 1
                 if len(hits) < limit:
                     hits.append(
-                        SearchHit(
+                        SearchHit.model_construct(
                             label=exp_id,
                             sublabel=f"tag: {tag} · {run_count} runs",
                             entity_type="experiment",
@@ -376,7 +432,7 @@ def _search_experiment_tags(store: StoreAdapter, q: str, limit: int) -> SearchGr
                         )
                     )
                 break
-    return SearchGroup(
+    return SearchGroup.model_construct(
         category="tags",
         label="Tags",
         scope="experiment",
@@ -397,7 +453,7 @@ def _search_run_tags(store: StoreAdapter, q: str, limit: int) -> SearchGroup:
         offset=0,
     )
     hits = [
-        SearchHit(
+        SearchHit.model_construct(
             label=r.record.run_id,
             sublabel=r.record.experiment_id,
             entity_type="run",
@@ -405,7 +461,7 @@ def _search_run_tags(store: StoreAdapter, q: str, limit: int) -> SearchGroup:
         )
         for r in runs
     ]
-    return SearchGroup(
+    return SearchGroup.model_construct(
         category="run_tags",
         label="Run tags",
         scope="run",
@@ -415,11 +471,12 @@ def _search_run_tags(store: StoreAdapter, q: str, limit: int) -> SearchGroup:
 
 
 @router.get("", response_model=SearchResponse)
-async def search(
+def search(
+    request: Request,
     store: Annotated[StoreAdapter, Depends(get_store)],
     q: str = Query(..., min_length=1),
     limit: int = Query(default=5, ge=1, le=200),
-) -> SearchResponse:
+) -> Response:
     """
     Fast search across experiments, runs, field names/values, fingerprints, artifacts.
 
@@ -430,16 +487,19 @@ async def search(
     """
     q = q.strip()
     if not q:
-        return SearchResponse(query=q, groups=[])
+        return _json_response(
+            request, SearchResponse.model_construct(query=q, groups=[])
+        )
 
     # Fast path: SQL-native search for Postgres stores
-    if isinstance(store, SupportsSearch):
-        groups = store.search(q, limit)
-        return SearchResponse(query=q, groups=groups)
-
-    # Generic path: Python-loop search for FileStore and other backends
-    groups = _generic_search(store, q, limit)
-    return SearchResponse(query=q, groups=groups)
+    if (native_search := capabilities_of(store).search) is not None:
+        groups = native_search(q, limit)
+    else:
+        # Generic path: Python-loop search for FileStore and other backends
+        groups = _generic_search(store, q, limit)
+    return _json_response(
+        request, SearchResponse.model_construct(query=q, groups=groups)
+    )
 
 
 def _generic_search(
@@ -516,11 +576,12 @@ def _generic_search(
 
 
 @router.get("/logs", response_model=SearchResponse)
-async def search_logs(
+def search_logs(
+    request: Request,
     store: Annotated[StoreAdapter, Depends(get_store)],
     q: str = Query(..., min_length=1),
     limit: int = Query(default=5, ge=1, le=200),
-) -> SearchResponse:
+) -> Response:
     """
     Full-text search in log contents. Slower; scans up to LOG_SEARCH_MAX_RUNS runs.
 
@@ -529,7 +590,10 @@ async def search_logs(
     """
     q = q.strip()
     if not q:
-        return SearchResponse(query=q, groups=[], truncated=False)
+        return _json_response(
+            request,
+            SearchResponse.model_construct(query=q, groups=[], truncated=False)
+        )
 
     q_lower = q.lower()
     hits: list[SearchHit] = []
@@ -558,7 +622,7 @@ async def search_logs(
                         "..." if len(line.strip()) > 80 else ""
                     )
                     hits.append(
-                        SearchHit(
+                        SearchHit.model_construct(
                             label=run.record.run_id,
                             sublabel=f"{log_name}: {snippet}",
                             entity_type="run",
@@ -567,16 +631,19 @@ async def search_logs(
                     )
                     break  # One hit per run per log file
 
-    return SearchResponse(
-        query=q,
-        groups=[
-            SearchGroup(
-                category="logs",
-                label="Log contents",
-                scope="run",
-                hits=hits,
-                total=len(hits) if len(hits) < limit else len(hits) + 1,
-            )
-        ],
-        truncated=truncated,
+    return _json_response(
+        request,
+        SearchResponse.model_construct(
+            query=q,
+            groups=[
+                SearchGroup.model_construct(
+                    category="logs",
+                    label="Log contents",
+                    scope="run",
+                    hits=hits,
+                    total=len(hits) if len(hits) < limit else len(hits) + 1,
+                )
+            ],
+            truncated=truncated,
+        )
     )
@@ -35,8 +35,8 @@ class StoreAdapter(Protocol):
         """Return filtered runs + total count."""
         ...
 
-    def get_run(self, run_id: str) -> RunResponse | None:
-        """Get a single run by ID."""
+    def get_run(self, run_id: str, *, include_derived: bool = True) -> RunResponse | None:
+        """Get a single run by ID (derived metrics skipped if not included)."""
         ...
 
     def get_field_index(self, filter: FilterSpec | None = None) -> FieldIndex:
@@ -113,6 +113,7 @@ export interface RunListResponse {
   total: number;
   limit: number;
   offset: number;
+  next_cursor?: string | null;
 }
 
 // Field index models
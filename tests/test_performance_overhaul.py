@@ -2,7 +2,7 @@
 Tests for the Atlas performance overhaul (atlas-side).
 
 Covers:
-- SupportsSearch capability protocol dispatch
+- Store capability dispatch (StoreCapabilities)
 - Generic search single-pass fixes (no doubled loops)
 - TTL cache initialization and invalidation
 """
@@ -10,6 +10,7 @@ Covers:
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -23,26 +24,46 @@ import pytest
 class TestSupportsSearchProtocol:
     """Tests for SupportsSearch capability dispatch."""
 
-    def test_protocol_is_runtime_checkable(self):
-        """SupportsSearch is a runtime-checkable protocol."""
-        from atlas.capabilities import SupportsSearch
+    def test_store_caps_record_is_used(self):
+        """Adapters that build a StoreCapabilities record expose it directly."""
+        from atlas.capabilities import StoreCapabilities, capabilities_of
 
         class MockSearchStore:
+            def __init__(self):
+                self.caps = StoreCapabilities(search=self.search)
+
             def search(self, q: str, limit: int = 5) -> list:
                 return []
 
         store = MockSearchStore()
-        assert isinstance(store, SupportsSearch)
+        caps = capabilities_of(store)
+        assert caps is store.caps
+        assert caps.search is not None
+        assert caps.refresh is None
+        assert caps.compute_aggregate_sql is None
 
-    def test_non_search_store_not_instance(self):
-        """Objects without search() are not SupportsSearch."""
-        from atlas.capabilities import SupportsSearch
+    def test_non_search_store_has_no_search(self):
+        """Objects without search() expose no search capability."""
+        from atlas.capabilities import capabilities_of
 
         class PlainStore:
             pass
 
-        store = PlainStore()
-        assert not isinstance(store, SupportsSearch)
+        assert capabilities_of(PlainStore()).search is None
+
+    def test_structural_fallback_is_cached_per_type(self):
+        """Stores without caps are checked structurally, once per class."""
+        from atlas.capabilities import _type_caps_cache, capabilities_of
+
+        class DuckSearchStore:
+            def search(self, q: str, limit: int = 5) -> list:
+                return ["hit"]
+
+        caps = capabilities_of(DuckSearchStore())
+        assert caps.search is not None
+        assert caps.search("q") == ["hit"]
+        assert caps.refresh is None
+        assert _type_caps_cache[DuckSearchStore] == ("search",)
 
 
 # =========================================================================
@@ -152,3 +173,1172 @@ class TestGenericSearchSinglePass:
         # query_runs should be called 3 times (once per experiment)
         # NOT 6 times (doubled loop)
         assert mock_store.query_runs.call_count == 3
+
+
+def _search_client(groups):
+    """TestClient for the search router over a store with native search."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from atlas.capabilities import StoreCapabilities
+    from atlas.deps import get_store
+    from atlas.routers import search_router
+
+    store = SimpleNamespace(caps=StoreCapabilities(search=lambda q, limit: groups))
+    app = FastAPI()
+    app.include_router(search_router)
+    app.dependency_overrides[get_store] = lambda: store
+    return TestClient(app)
+
+
+class TestSearchEndpoint:
+    """Tests for the /api/search response path."""
+
+    def test_native_search_response_body(self):
+        """Constructed search models are serialized with defaults filled in."""
+        from atlas.models import SearchGroup, SearchHit
+
+        hit = SearchHit.model_construct(
+            label="r1", entity_type="run", entity_id="r1"
+        )
+        group = SearchGroup.model_construct(
+            category="runs", label="Runs", scope="run", hits=[hit], total=1
+        )
+
+        response = _search_client([group]).get("/api/search?q=r1")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "query": "r1",
+            "groups": [
+                {
+                    "category": "runs",
+                    "label": "Runs",
+                    "scope": "run",
+                    "hits": [
+                        {
+                            "label": "r1",
+                            "sublabel": None,
+                            "entity_type": "run",
+                            "entity_id": "r1",
+                            "field": None,
+                            "value": None,
+                        }
+                    ],
+                    "total": 1,
+                }
+            ],
+            "truncated": False,
+        }
+
+    def test_ndjson_streams_groups_and_hits(self):
+        """Accept: application/x-ndjson yields one object per line."""
+        import json
+
+        from atlas.models import SearchGroup, SearchHit
+
+        hits = [
+            SearchHit.model_construct(label=r, entity_type="run", entity_id=r)
+            for r in ("r1", "r2")
+        ]
+        group = SearchGroup.model_construct(
+            category="runs", label="Runs", scope="run", hits=hits, total=2
+        )
+
+        response = _search_client([group]).get(
+            "/api/search?q=r", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["kind"] for line in lines] == ["search", "group", "hit", "hit"]
+        assert lines[0] == {"kind": "search", "query": "r", "truncated": False}
+        assert lines[1]["total"] == 2
+        assert lines[3]["entity_id"] == "r2"
+
+    def test_openapi_keeps_search_response_schema(self):
+        """The route still documents SearchResponse."""
+        client = _search_client([])
+        schema = client.get("/openapi.json").json()
+        ok = schema["paths"]["/api/search"]["get"]["responses"]["200"]
+
+        assert ok["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/SearchResponse"
+        }
+
+
+# =========================================================================
+# Store singleton
+# =========================================================================
+
+
+class TestStoreSingleton:
+    """Tests for the process-wide store adapter singleton."""
+
+    def test_singleton_reused_until_reset(self, monkeypatch):
+        """The adapter is built once from the environment; reset clears it."""
+        import atlas.deps as deps
+
+        created = []
+
+        class FakeAdapter:
+            def __init__(self, connection_string, file_root=None):
+                created.append((connection_string, file_root))
+
+        monkeypatch.setattr(deps, "PostgresStoreAdapter", FakeAdapter)
+        monkeypatch.setenv("ATLAS_STORE_PATH", "postgresql://localhost/metalab")
+        monkeypatch.setenv("ATLAS_FILE_ROOT", "/data")
+        deps.reset_store_cache()
+
+        first = deps._get_postgres_store_singleton()
+        assert deps._get_postgres_store_singleton() is first
+        assert created == [("postgresql://localhost/metalab", "/data")]
+
+        deps.reset_store_cache()
+        assert deps._get_postgres_store_singleton() is not first
+        assert len(created) == 2
+        deps.reset_store_cache()
+
+    def test_get_store_returns_initialized_store(self, monkeypatch):
+        """get_store() returns the adapter built at startup."""
+        import atlas.deps as deps
+
+        class FakeAdapter:
+            def __init__(self, connection_string, file_root=None):
+                self.connection_string = connection_string
+
+        monkeypatch.setattr(deps, "PostgresStoreAdapter", FakeAdapter)
+        monkeypatch.setenv("ATLAS_STORE_PATH", "postgresql://localhost/metalab")
+        monkeypatch.delenv("ATLAS_FILE_ROOT", raising=False)
+        deps.reset_store_cache()
+
+        store = deps.init_store()
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+        assert deps.get_store(request) is store
+
+        # A store placed on app state (by the CLI / lifespan) takes precedence
+        other = object()
+        request.app.state.store = other
+        assert deps.get_store(request) is other
+        deps.reset_store_cache()
+
+    def test_init_store_rejects_non_postgres_url(self, monkeypatch):
+        """Store URL validation happens in init_store()."""
+        import atlas.deps as deps
+
+        monkeypatch.setenv("ATLAS_STORE_PATH", "/tmp/file-store")
+        deps.reset_store_cache()
+
+        with pytest.raises(ValueError, match="PostgreSQL URL"):
+            deps.init_store()
+        deps.reset_store_cache()
+
+    def test_app_starts_without_store(self, monkeypatch):
+        """A missing store URL doesn't stop startup; store routes fail on use."""
+        import atlas.deps as deps
+        from fastapi.testclient import TestClient
+
+        from atlas.main import app
+
+        monkeypatch.delenv("ATLAS_STORE_PATH", raising=False)
+        monkeypatch.setattr(app.state, "store", None, raising=False)
+        deps.reset_store_cache()
+
+        with TestClient(app) as client:
+            assert client.get("/api/health").json()["status"] == "healthy"
+            assert app.state.store is None
+            with pytest.raises(ValueError, match="ATLAS_STORE_PATH is not set"):
+                client.get("/api/meta/experiments")
+        deps.reset_store_cache()
+
+    def test_store_routes_run_in_threadpool(self):
+        """Store calls block, so /api routes must be sync (threadpool) handlers."""
+        import inspect
+
+        from fastapi.routing import APIRoute
+
+        from atlas.main import app
+
+        async_routes = [
+            route.path
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            and route.path.startswith("/api/")
+            and route.path != "/api/health"
+            and inspect.iscoroutinefunction(route.endpoint)
+        ]
+        assert async_routes == []
+
+
+# =========================================================================
+# Postgres adapter
+# =========================================================================
+
+
+class _RowFactoryCursor:
+    """Wraps a mock cursor, applying a psycopg row factory on iteration."""
+
+    def __init__(self, cursor, row_factory):
+        self._cursor = cursor
+        self._make_row = row_factory(cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        return map(self._make_row, self._cursor)
+
+
+def _pg_store(cursor):
+    """PostgresStoreAdapter without a database; queries go to ``cursor``."""
+    from contextlib import nullcontext
+    from unittest.mock import patch
+
+    from atlas.pg_store import PostgresStoreAdapter
+
+    with patch.object(PostgresStoreAdapter, "_ensure_connected"), patch.object(
+        PostgresStoreAdapter, "_refresh_schema_cache"
+    ):
+        store = PostgresStoreAdapter("postgresql://localhost/metalab")
+
+    conn = MagicMock()
+    conn.cursor.side_effect = lambda row_factory=None, name=None: (
+        cursor if row_factory is None else _RowFactoryCursor(cursor, row_factory)
+    )
+    cursor.__enter__.return_value = cursor
+    store._get_conn = lambda: nullcontext(conn)
+    return store
+
+
+class TestSchemaDiscovery:
+    """Tests for experiment -> schema discovery."""
+
+    def test_refresh_uses_one_union_query(self):
+        """All schemas are scanned in a single round trip."""
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("exp_a", "s1"), ("exp_b", "s2")]
+        store = _pg_store(cursor)
+        store._discover_metalab_schemas = lambda: ["s1", "s2"]
+
+        store._refresh_schema_cache()
+
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert sql.count("UNION ALL") == 1
+        assert params == ["s1", "s2"]
+        assert store._experiment_schemas == {"exp_a": "s1", "exp_b": "s2"}
+        assert store._get_all_schemas() == ["s1", "s2"]
+
+    def test_unknown_experiment_is_probed_once(self):
+        """A miss probes that experiment only, and the miss is remembered."""
+        from datetime import timedelta
+
+        cursor = MagicMock()
+        cursor.fetchone.return_value = None
+        store = _pg_store(cursor)
+        store._experiment_schemas = {"exp_a": "s1"}
+        store._all_schemas_cache = ["s1"]
+        store._schema_cache_expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+        store._discover_metalab_schemas = lambda: ["s1", "s2"]
+        store._refresh_schema_cache = MagicMock()
+
+        assert store._get_schema_for_experiment("typo") is None
+        assert store._get_schema_for_experiment("typo") is None
+        assert store._get_schema_for_experiment("exp_a") == "s1"
+
+        store._refresh_schema_cache.assert_not_called()
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert sql.count("WHERE EXISTS") == 2
+        assert params == ["s1", "typo", "s2", "typo"]
+        assert store._get_all_schemas() == ["s1"]
+
+    def test_discovery_skips_schemas_that_need_quoting(self):
+        """Only schema names safe to interpolate unquoted are used."""
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("metalab", True), ("Team-A", False), ("user", False)]
+        store = _pg_store(cursor)
+
+        assert store._discover_metalab_schemas() == ["metalab"]
+        assert "quote_ident(table_schema) = table_schema" in cursor.execute.call_args.args[0]
+
+    def test_find_schema_for_run_probes_all_schemas(self):
+        """Run lookup probes every schema in one query and caches the hit."""
+        cursor = MagicMock()
+        cursor.fetchone.return_value = ("s2", "exp")
+        store = _pg_store(cursor)
+        store._get_all_schemas = lambda: ["s1", "s2"]
+
+        assert store._find_schema_for_run("run-1") == "s2"
+        assert store._find_schema_for_run("run-1") == "s2"
+        assert store._get_experiment_id_for_run("run-1") == "exp"
+
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert sql.count("WHERE run_id = %s") == 2
+        assert sql.endswith("LIMIT 1")
+        assert params == ["s1", "run-1", "s2", "run-1"]
+
+    def test_find_schema_for_run_does_not_cache_misses(self):
+        """A run that isn't written yet is looked up again next time."""
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = [None, ("s1", "exp")]
+        store = _pg_store(cursor)
+        store._get_all_schemas = lambda: ["s1"]
+
+        assert store._find_schema_for_run("run-1") is None
+        assert store._find_schema_for_run("run-1") == "s1"
+
+
+def test_slim_rows_serialize_without_validation():
+    """Slim rows skip validation but still serialize cleanly."""
+    started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    row = (
+        "r1", "exp", "success", started, started, 5, "c", "p", "s",
+        {"lr": 0.1}, {"loss": 0.5}, ["t"], None, {"host": "h"}, [], None, None,
+    )
+    run = _pg_store(MagicMock())._slim_row_to_run_response(row)
+
+    data = run.model_dump(mode="json", warnings="error")
+
+    assert data["record"]["status"] == "success"
+    assert data["record"]["provenance"]["host"] == "h"
+    assert data["record"]["provenance"]["extra"] == {}
+    assert data["params"] == {"lr": 0.1}
+    assert data["artifacts"] == []
+
+
+def test_get_run_uses_sql_shaped_artifacts():
+    """get_run takes artifacts (private metadata already dropped) from SQL."""
+    cursor = MagicMock()
+    record = {"run_id": "r1", "status": "success", "started_at": "2025-01-01T00:00:00Z"}
+    artifacts = [{"artifact_id": "a1", "name": "plot", "metadata": {"dpi": 300}}]
+    cursor.fetchone.return_value = ("r1", record, artifacts, None)
+    store = _pg_store(cursor)
+    store._find_schema_for_run = lambda run_id: "s1"
+
+    run = store.get_run("r1")
+
+    sql = cursor.execute.call_args.args[0]
+    assert "r.record_json - 'artifacts'" in sql
+    assert cursor.execute.call_args.kwargs == {"prepare": True}
+    assert "left(m.key, 1) <> '_'" in sql
+    assert [(a.artifact_id, a.metadata) for a in run.artifacts] == [("a1", {"dpi": 300})]
+
+
+def test_artifact_info_matched_in_sql():
+    """The artifact is found by name in Postgres; one small row comes back."""
+    cursor = MagicMock()
+    cursor.fetchone.return_value = ("pgblob://a1", "png", 42)
+    store = _pg_store(cursor)
+    store._find_schema_for_run = lambda run_id: "s1"
+
+    assert store._get_artifact_info("r1", "plot") == ("s1", "pgblob://a1", "png", 42)
+    sql, params = cursor.execute.call_args.args
+    assert "jsonb_array_elements" in sql and params == ["r1", "plot"]
+    # size_bytes may be stored as a float (1234.0); bigint alone rejects it
+    assert "(a->>'size_bytes')::numeric::bigint" in sql
+
+
+def test_get_run_skips_derived_when_not_included():
+    """include_derived=False never reads the derived table."""
+    cursor = MagicMock()
+    record = {"run_id": "r1", "status": "success", "started_at": "2025-01-01T00:00:00Z"}
+    cursor.fetchone.return_value = ("r1", record, [], None)
+    store = _pg_store(cursor)
+    store._find_schema_for_run = lambda run_id: "s1"
+
+    store.get_run("r1")
+    assert "s1.derived d WHERE d.run_id = r.run_id" in cursor.execute.call_args.args[0]
+    assert "JOIN" not in cursor.execute.call_args.args[0]
+
+    run = store.get_run("r1", include_derived=False)
+    assert "derived" not in cursor.execute.call_args.args[0]
+    assert run.derived_metrics == {}
+
+
+def test_npz_preview_decodes_only_small_vectors():
+    """npz previews read shapes from headers; only 1-D values are decoded."""
+    import io
+
+    import numpy as np
+
+    buf = io.BytesIO()
+    np.savez_compressed(buf, loss=np.arange(3, dtype=np.float32), grid=np.zeros((4, 5)))
+    store = _pg_store(MagicMock())
+    store._get_artifact_info = lambda run_id, name: ("s1", "pgblob://a1", "npz", 10)
+    store._get_blob_content = lambda artifact_id, schema: buf.getvalue()
+
+    arrays = store.get_artifact_preview("r1", "arrays").preview.numpy_info.arrays
+
+    assert (arrays["loss"].dtype, arrays["loss"].values) == ("float32", [0.0, 1.0, 2.0])
+    assert (arrays["grid"].shape, arrays["grid"].values) == ([4, 5], None)
+
+
+def test_npz_preview_reads_v3_headers_and_skips_bad_members():
+    """A 3.0 header is decoded fully; one unreadable member drops alone."""
+    import io
+    import zipfile
+
+    import numpy as np
+    from numpy.lib import format as npy_format
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as npz:
+        with npz.open("v3.npy", "w") as f:
+            npy_format.write_array(f, np.arange(2.0), version=(3, 0))
+        with npz.open("ok.npy", "w") as f:
+            npy_format.write_array(f, np.ones((2, 2)))
+        npz.writestr("bad.npy", b"not an array")
+    store = _pg_store(MagicMock())
+    store._get_artifact_info = lambda run_id, name: ("s1", "pgblob://a1", "npz", 10)
+    store._get_blob_content = lambda artifact_id, schema: buf.getvalue()
+
+    arrays = store.get_artifact_preview("r1", "arrays").preview.numpy_info.arrays
+
+    assert set(arrays) == {"v3", "ok"}
+    assert (arrays["v3"].shape, arrays["v3"].values) == ([2], [0.0, 1.0])
+    assert (arrays["ok"].shape, arrays["ok"].values) == ([2, 2], None)
+
+
+def test_list_logs_scans_log_dir(tmp_path):
+    """Log names are the run's *.log files with the run prefix removed."""
+    log_dir = tmp_path / "exp" / "logs"
+    log_dir.mkdir(parents=True)
+    for filename in ("r1_stdout.log", "r1_train_step.log", "r10_stdout.log", "r1_x.txt"):
+        (log_dir / filename).touch()
+    store = _pg_store(MagicMock())
+    store._file_root_path = tmp_path
+    store._get_experiment_id_for_run = lambda run_id: "exp"
+
+    assert store.list_logs("r1") == ["stdout", "train_step"]
+    assert store.list_logs("r2") == []
+
+
+def _field_values_store(batches, total=None):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = (total,)
+    cursor.fetchmany.side_effect = batches
+    store = _pg_store(cursor)
+    store._get_all_schemas = lambda: ["s1"]
+    return store, cursor
+
+
+def test_field_values_stream_from_server_side_cursor():
+    """Rows that fit in max_points come back in one query, their count the total."""
+    from atlas.models import FieldValuesRequest
+
+    store, cursor = _field_values_store(
+        [[("r1", 1.0, "a")], [("r2", 2.0, "b"), ("r3", None, "c")], []]
+    )
+
+    result = store.get_field_values(
+        FieldValuesRequest(fields=["metrics.loss", "params.opt"], max_points=5)
+    )
+
+    with store._get_conn() as conn:
+        names = [c.kwargs.get("name") for c in conn.cursor.call_args_list]
+    assert "atlas_field_values" in names
+    [(sql, params)] = [c.args for c in cursor.execute.call_args_list]
+    assert "COUNT(*)" not in sql and params == [6]
+    assert result.fields == {
+        "metrics.loss": [1.0, 2.0, None],
+        "params.opt": ["a", "b", "c"],
+    }
+    assert (result.run_ids, result.total, result.returned) == (["r1", "r2", "r3"], 3, 3)
+    assert not result.sampled
+
+
+def test_field_values_sample_when_total_exceeds_max_points():
+    """Overflowing max_points drops those rows, counts, and samples."""
+    from atlas.models import FieldValuesRequest
+
+    store, cursor = _field_values_store(
+        [[("r1", 1.0), ("r2", 2.0)], [], [("r4", 4.0)], []], total=5
+    )
+
+    result = store.get_field_values(
+        FieldValuesRequest(fields=["metrics.loss"], max_points=1)
+    )
+
+    sqls = [c.args[0] for c in cursor.execute.call_args_list]
+    assert "OVER ()" not in sqls[0] and "SELECT COUNT(*)" in sqls[1]
+    assert "setseed" in sqls[2] and "TABLESAMPLE" in sqls[3]
+    assert (result.run_ids, result.fields) == (["r4"], {"metrics.loss": [4.0]})
+    assert (result.total, result.returned, result.sampled) == (5, 1, True)
+
+
+def test_jsonb_field_index_aggregates_in_sql():
+    """JSONB introspection reads one summary row per field, in two queries."""
+    from atlas.models import FieldType
+
+    cursor = MagicMock()
+    cursor.fetchall.return_value = [
+        ("params", "opt", "string", 3, None, None, ["sgd", "adam"]),
+        ("params", "flag", "boolean", 2, None, None, ["True"]),
+        ("metrics", "loss", "number", 3, 0.1, 0.9, None),
+        ("derived", "score", "number", 1, 2.0, 2.0, None),
+    ]
+    cursor.fetchone.return_value = (3,)
+    store = _pg_store(cursor)
+    store._get_all_schemas = lambda: ["s1", "s2"]
+
+    index = store._get_field_index_from_jsonb(cursor, None)
+
+    assert cursor.execute.call_count == 2
+    stats_sql = cursor.execute.call_args_list[0].args[0]
+    assert "jsonb_each" in stats_sql and "GROUP BY ns, key" in stats_sql
+    assert stats_sql.count("ORDER BY started_at DESC LIMIT 1000") == 2
+    assert index.run_count == 3
+    assert index.params_fields["opt"].values == ["adam", "sgd"]
+    assert index.params_fields["flag"].type == FieldType.BOOLEAN
+    assert (index.metrics_fields["loss"].min_value, index.metrics_fields["loss"].max_value) == (0.1, 0.9)
+    assert index.derived_fields["score"].count == 1
+
+
+def test_field_catalog_read_in_constant_round_trips():
+    """Catalog probe, catalog rows and run count are one query each."""
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = [
+        [("s2",)],
+        [(0, "metrics", "loss", "numeric", 4, None, 0.1, 0.9)],
+    ]
+    cursor.fetchone.return_value = (4,)
+    store = _pg_store(cursor)
+    store._get_all_schemas = lambda: ["s1", "s2"]
+
+    index = store._get_field_index_from_catalog(cursor, None)
+
+    probe, catalog, count = cursor.execute.call_args_list
+    assert "to_regclass" in probe.args[0] and probe.args[1] == [["s1", "s2"]]
+    assert "s2.field_catalog" in catalog.args[0] and "s1." not in catalog.args[0]
+    assert "UNION ALL" not in count.args[0] and "s2.runs" in count.args[0]
+    assert index.run_count == 4
+    assert index.metrics_fields["loss"].max_value == 0.9
+
+
+def test_refreshing_cache_serves_stale_and_refreshes_once(monkeypatch):
+    """Stale entries return immediately; only one background reload starts."""
+    from atlas import pg_store
+
+    started = []
+    monkeypatch.setattr(
+        pg_store.threading,
+        "Thread",
+        lambda target, **kw: SimpleNamespace(start=lambda: started.append(target)),
+    )
+    clock = [100.0]
+    monkeypatch.setattr(pg_store.time, "monotonic", lambda: clock[0])
+    cache = pg_store._RefreshingCache(ttl=60, hard_ttl=600)
+    loads = iter(["v1", "v2", "v3"])
+    load = lambda: next(loads)
+
+    assert cache.get("k", load) == "v1"
+    clock[0] += 120
+    assert cache.get("k", load) == "v1"
+    assert cache.get("k", load) == "v1"
+    assert len(started) == 1
+
+    started[0]()
+    assert cache.get("k", load) == "v2"
+    clock[0] += 1000
+    assert cache.get("k", load) == "v3"
+
+
+class TestKeysetPagination:
+    """Tests for cursor-based pagination in query_runs_page."""
+
+    def test_cursor_roundtrip(self):
+        """Cursors carry the last sort value and run_id."""
+        from atlas.pg_store import _decode_run_cursor, _encode_run_cursor
+
+        started = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        cursor = _encode_run_cursor(None, "desc", started, "r9")
+        value, run_id = _decode_run_cursor(cursor, None, "desc")
+
+        assert value == "2025-01-01T12:00:00+00:00"
+        assert run_id == "r9"
+
+    def test_malformed_cursor_raises(self):
+        """Garbage cursors are rejected with ValueError."""
+        from atlas.pg_store import _decode_run_cursor
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            _decode_run_cursor("not-a-cursor", None, "desc")
+
+    @pytest.mark.parametrize("sort_value", [[1, 2], {"a": 1}, True])
+    def test_non_scalar_sort_value_raises(self, sort_value):
+        """Hand-edited cursors with list/object/bool sort values are rejected."""
+        import base64
+
+        import orjson
+
+        from atlas.pg_store import _decode_run_cursor
+
+        cursor = base64.urlsafe_b64encode(
+            orjson.dumps([None, "desc", sort_value, "r1"])
+        ).decode()
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            _decode_run_cursor(cursor, None, "desc")
+
+    @pytest.mark.parametrize(
+        "sort_by,sort_order", [("metrics.loss", "desc"), (None, "asc")]
+    )
+    def test_cursor_for_other_sort_raises(self, sort_by, sort_order):
+        """A cursor replayed after sort_by/sort_order changes is a ValueError."""
+        from atlas.pg_store import _decode_run_cursor, _encode_run_cursor
+
+        cursor = _encode_run_cursor(None, "desc", "2025-01-01T00:00:00", "r1")
+        with pytest.raises(ValueError, match="different sort"):
+            _decode_run_cursor(cursor, sort_by, sort_order)
+
+    @pytest.mark.parametrize(
+        "sort_dir,value,expected",
+        [
+            ("DESC", 1.5, "((m), r.run_id) < (%s, %s)"),
+            ("ASC", 1.5, "(((m), r.run_id) > (%s, %s) OR (m) IS NULL)"),
+            ("DESC", None, "((m) IS NULL AND r.run_id < %s OR (m) IS NOT NULL)"),
+            ("ASC", None, "((m) IS NULL AND r.run_id > %s)"),
+        ],
+    )
+    def test_keyset_clause_null_ordering(self, sort_dir, value, expected):
+        """The keyset condition follows Postgres' NULL placement per direction."""
+        from atlas.pg_store import _keyset_clause
+
+        clause, params = _keyset_clause("m", sort_dir, value, "r1")
+
+        assert clause == expected
+        assert params[-1] == "r1"
+
+    def test_full_page_returns_next_cursor(self):
+        """A cursor request adds the keyset clause to the page query only."""
+        from atlas.pg_store import _decode_run_cursor, _encode_run_cursor
+
+        cursor = MagicMock()
+        started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        row = (
+            "r2", "exp", "success", started, started, 5, "c", "p", "s",
+            {}, {}, [], None, {}, [], None, None, started,
+        )
+        cursor.fetchone.return_value = (10,)
+        cursor.__iter__.return_value = iter([row])
+        store = _pg_store(cursor)
+        store._get_all_schemas = lambda: ["s1"]
+
+        runs, total, next_cursor = store.query_runs_page(
+            limit=1, cursor=_encode_run_cursor(None, "desc", started, "r1")
+        )
+
+        count_call, page_call = cursor.execute.call_args_list
+        assert "r.run_id) <" not in count_call.args[0]
+        assert "r.run_id) < (%s, %s)" in page_call.args[0]
+        assert page_call.args[1][-2:] == [1, 0]
+        assert total == 10
+        assert runs[0].record.run_id == "r2"
+        assert _decode_run_cursor(next_cursor, None, "desc")[1] == "r2"
+
+
+class TestRunCounts:
+    """Tests for query_runs count modes."""
+
+    def _store(self, total):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (total,)
+        store = _pg_store(cursor)
+        store._get_all_schemas = lambda: ["s1"]
+        return store, cursor
+
+    def test_cached_count_skips_repeat_count_query(self):
+        """A second identical page request reuses the cached total."""
+        store, cursor = self._store(42)
+
+        assert store.query_runs()[1] == 42
+        assert store.query_runs(offset=100)[1] == 42
+
+        count_queries = [
+            c for c in cursor.execute.call_args_list if "COUNT(*)" in c.args[0]
+        ]
+        assert len(count_queries) == 1
+
+    def test_exact_count_always_queries(self):
+        """count_mode="exact" bypasses the cache and never uses a window count."""
+        store, cursor = self._store(42)
+
+        store.query_runs(count_mode="exact")
+        store.query_runs(count_mode="exact")
+
+        assert cursor.execute.call_count == 4
+        assert not any("OVER ()" in c.args[0] for c in cursor.execute.call_args_list)
+
+    def test_filter_order_does_not_change_sql(self):
+        """Clauses are canonicalized with their params and prepared."""
+        from atlas.models import FieldFilter, FilterSpec
+
+        a = FieldFilter(field="params.opt", value="adam")
+        b = FieldFilter(field="metrics.loss", op="lt", value=1)
+        store, cursor = self._store(1)
+
+        store.query_runs(FilterSpec(field_filters=[a, b]), count_mode="exact")
+        store.query_runs(FilterSpec(field_filters=[b, a]), count_mode="exact")
+
+        first, second = cursor.execute.call_args_list[0], cursor.execute.call_args_list[2]
+        assert first.args == second.args
+        assert first.args[1] == [1.0, "adam"]
+        assert first.kwargs == {"prepare": True}
+
+    def test_limit_zero_only_counts(self):
+        """limit=0 returns the total without running the page query."""
+        store, cursor = self._store(7)
+
+        assert store.query_runs(limit=0) == ([], 7)
+        cursor.execute.assert_called_once()
+        assert "COUNT(*)" in cursor.execute.call_args.args[0]
+
+    def test_unsatisfiable_filter_skips_database(self):
+        """An empty IN list matches nothing and never reaches Postgres."""
+        from atlas.models import FilterSpec
+
+        store, cursor = self._store(7)
+        spec = FilterSpec(
+            field_filters=[{"field": "params.x", "op": "in", "value": []}]
+        )
+
+        assert store.query_runs(spec) == ([], 0)
+        cursor.execute.assert_not_called()
+
+    def test_empty_status_list_is_no_filter(self):
+        """status=[] applies no status filter rather than matching nothing."""
+        from atlas.models import FilterSpec
+
+        store, cursor = self._store(7)
+
+        _, total = store.query_runs(FilterSpec(status=[]))
+
+        assert total == 7
+        assert all(
+            "r.status IN" not in c.args[0] for c in cursor.execute.call_args_list
+        )
+
+    def test_estimate_uses_reltuples_when_unfiltered(self):
+        """An unfiltered estimate reads pg_class instead of scanning."""
+        store, cursor = self._store(300_000)
+
+        _, total = store.query_runs(count_mode="estimate")
+
+        count_call = cursor.execute.call_args_list[0]
+        assert "reltuples" in count_call.args[0]
+        assert count_call.args[1] == [["s1.runs"]]
+        assert total == 300_000
+
+
+class TestSortIndex:
+    """Tests for the opt-in params/metrics sort index."""
+
+    def _store(self, auto_sort_index):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (0,)
+        store = _pg_store(cursor)
+        store._auto_sort_index = auto_sort_index
+        store._get_all_schemas = lambda: ["s1", "s2"]
+        return store
+
+    def test_metric_sort_creates_index_once_per_schema(self):
+        """The index matches the ORDER BY expression and is issued once."""
+        from unittest.mock import patch
+
+        store = self._store(True)
+        with patch("atlas.pg_store.threading.Thread") as thread:
+            store.query_runs(sort_by="metrics.loss")
+            store.query_runs(sort_by="metrics.loss")
+
+        thread.assert_called_once()
+        statements = [
+            s for s in thread.call_args.kwargs["args"][0] if "idx_runs_sort_" in s
+        ]
+        assert [s.split(" ON ")[1] for s in statements] == [
+            "s1.runs (((record_json->'metrics'->>'loss')::float))",
+            "s2.runs (((record_json->'metrics'->>'loss')::float))",
+        ]
+        assert all("CONCURRENTLY IF NOT EXISTS" in s for s in statements)
+
+    def test_disabled_by_default(self):
+        """Without the opt-in no index is created."""
+        from unittest.mock import patch
+
+        with patch("atlas.pg_store.threading.Thread") as thread:
+            self._store(False).query_runs(sort_by="metrics.loss")
+
+        thread.assert_not_called()
+
+    def test_column_sort_only_creates_experiment_index(self):
+        """Table-column sorts get the (experiment_id, started_at) index only."""
+        from unittest.mock import patch
+
+        with patch("atlas.pg_store.threading.Thread") as thread:
+            self._store(True).query_runs(sort_by="record.started_at")
+
+        assert [s.split(" ON ")[1] for s in thread.call_args.kwargs["args"][0]] == [
+            "s1.runs (experiment_id, started_at DESC)",
+            "s2.runs (experiment_id, started_at DESC)",
+        ]
+
+
+class TestResolveSort:
+    """Tests for sort_by -> SQL expression resolution."""
+
+    @pytest.mark.parametrize(
+        "sort_by,expected",
+        [
+            (None, ("r.started_at", False)),
+            ("record.duration_ms", ("r.duration_ms", False)),
+            ("params.opt.lr", ("(record_json->'params_resolved'->>'opt.lr')", True)),
+            ("metrics.best_f", ("(record_json->'metrics'->>'best_f')::float", True)),
+            ("derived.score", ("r.started_at", False)),
+        ],
+    )
+    def test_resolves_known_fields(self, sort_by, expected):
+        from atlas.pg_store import _resolve_sort
+
+        assert _resolve_sort(sort_by) == expected
+
+    @pytest.mark.parametrize(
+        "sort_by", ["metrics.x') DESC; DROP TABLE runs; --", "record.tags", "params."]
+    )
+    def test_rejects_unsafe_or_unknown(self, sort_by):
+        from atlas.pg_store import _resolve_sort
+
+        with pytest.raises(ValueError, match="Cannot sort by"):
+            _resolve_sort(sort_by)
+
+
+@pytest.mark.parametrize(
+    "field,op,value,expected",
+    [
+        ("record.status", "in", ["success", "failed"], ("status IN (%s, %s)", ["success", "failed"])),
+        ("record.duration_ms", "contains", 5, ("duration_ms::text ILIKE %s", ["%5%"])),
+        ("record.tags", "eq", "a", ("(r.record_json->'tags')::text = %s", ["a"])),
+        ("record.tags", "lt", 1, ("", [])),
+        ("params.dim", "eq", 3, ("(record_json->'params_resolved'->>'dim')::float = %s", [3.0])),
+        ("params.opt", "eq", "adam", ("record_json->'params_resolved'->>'opt' = %s", ["adam"])),
+        ("metrics.loss", "ge", "0.5", ("(record_json->'metrics'->>'loss')::float >= %s", [0.5])),
+        ("derived.x", "eq", 1, ("", [])),
+    ],
+)
+def test_build_field_filter(field, op, value, expected):
+    """Operator tables produce the same clauses as the old branch chain."""
+    from atlas.models import FieldFilter
+
+    store = _pg_store(MagicMock())
+
+    assert store._build_field_filter(FieldFilter(field=field, op=op, value=value)) == expected
+
+
+@pytest.mark.parametrize("field", ["params.x' OR '1'='1", "metrics.a%b", "params."])
+def test_build_field_filter_rejects_unsafe_keys(field):
+    """params/metrics keys outside _SORT_KEY_RE never reach the SQL text."""
+    from atlas.models import FieldFilter
+
+    store = _pg_store(MagicMock())
+
+    with pytest.raises(ValueError, match="Cannot filter by"):
+        store._build_field_filter(FieldFilter(field=field, op="eq", value="a"))
+
+
+def test_pooled_connections_decode_jsonb():
+    """Pool connections load jsonb (text and binary) with orjson."""
+    import orjson
+    from psycopg import postgres
+    from psycopg.adapt import AdaptersMap
+    from psycopg.pq import Format
+
+    from atlas.pg_store import _configure_connection
+
+    conn = MagicMock()
+    conn.adapters = AdaptersMap(postgres.adapters)
+    _configure_connection(conn)
+
+    oid = postgres.types["jsonb"].oid
+    for fmt in (Format.TEXT, Format.BINARY):
+        loader = conn.adapters.get_loader(oid, fmt)(oid)
+        payload = b'{"a": [1]}' if fmt == Format.TEXT else b'\x01{"a": [1]}'
+        assert loader.load(payload) == {"a": [1]}
+        assert loader._loads is orjson.loads
+
+
+# =========================================================================
+# CLI helpers
+# =========================================================================
+
+
+class TestParsePgUrl:
+    """Tests for the CLI's display-only Postgres URL parser."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("postgresql://user@db.example:6543/lab", ("db.example", 6543, "lab")),
+            ("postgres://u:p@localhost/metalab?file_root=/x", ("localhost", 5432, "metalab")),
+            ("postgresql://", ("localhost", 5432, "metalab")),
+            ("postgresql://user@[::1]:5433/db", ("::1", 5433, "db")),
+        ],
+    )
+    def test_parse_pg_url(self, url, expected):
+        from atlas.cli import _parse_pg_url
+
+        assert _parse_pg_url(url) == expected
+
+
+# =========================================================================
+# Export
+# =========================================================================
+
+
+def _make_run(run_id: str, params=None, metrics=None, derived=None, finished=True):
+    """Build a RunResponse for export tests."""
+    from atlas.models import ProvenanceInfo, RecordFields, RunResponse, RunStatus
+
+    started = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    return RunResponse(
+        record=RecordFields(
+            run_id=run_id,
+            experiment_id="exp:1.0",
+            status=RunStatus.SUCCESS,
+            context_fingerprint="ctx",
+            params_fingerprint="p",
+            seed_fingerprint="s",
+            started_at=started,
+            finished_at=started if finished else None,
+            duration_ms=5 if finished else None,
+            provenance=ProvenanceInfo(),
+        ),
+        params=params or {},
+        metrics=metrics or {},
+        derived_metrics=derived or {},
+    )
+
+
+class TestExportTables:
+    """Tests for run flattening in atlas.export."""
+
+    def test_arrow_table_matches_dataframe_columns(self):
+        """runs_to_arrow_table has the same columns/values as runs_to_dataframe."""
+        pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        from atlas.export import runs_to_arrow_table, runs_to_dataframe
+
+        runs = [
+            _make_run("r1", params={"lr": 0.1}, metrics={"loss": 1.5}),
+            _make_run("r2", params={"lr": 0.2, "opt": "adam"}, derived={"auc": 0.9}),
+        ]
+        captured = ['{"x": 1}', None]
+
+        df = runs_to_dataframe(runs, captured_data_json=captured)
+        table = runs_to_arrow_table(runs, captured_data_json=captured)
+
+        assert table.column_names == list(df.columns)
+        assert table.column("param_opt").to_pylist() == [None, "adam"]
+        assert table.column("loss").to_pylist() == [1.5, None]
+        assert table.column("captured_data").to_pylist() == ['{"x": 1}', None]
+        assert table.schema.field("captured_data").type == "large_string"
+        assert table.column_names.index("captured_data") == 6
+
+    def test_arrow_table_mixed_types_fall_back_to_string(self):
+        """A field with mixed value types is exported as strings."""
+        pytest.importorskip("pyarrow")
+        from atlas.export import runs_to_arrow_table
+
+        runs = [_make_run("r1", params={"k": 1}), _make_run("r2", params={"k": "a"})]
+        table = runs_to_arrow_table(runs, include_data=False)
+
+        assert table.column("param_k").to_pylist() == ["1", "a"]
+
+    def test_csv_bytes_from_arrow_table(self):
+        """CSV export writes a header row and one line per run."""
+        pytest.importorskip("pyarrow")
+        from atlas.export import dataframe_to_csv_bytes, runs_to_arrow_table
+
+        runs = [_make_run("r1", params={"a": "x,y"}), _make_run("r2")]
+        lines = dataframe_to_csv_bytes(runs_to_arrow_table(runs)).decode().splitlines()
+
+        assert lines[0].split(",")[0] == '"run_id"'
+        assert len(lines) == 3
+        assert '"x,y"' in lines[1]
+
+    def test_parquet_bytes_chunked_roundtrip(self):
+        """Chunked Parquet export keeps one schema and embeds metadata."""
+        pa = pytest.importorskip("pyarrow")
+        import io
+
+        import pyarrow.parquet as pq
+
+        from atlas.export import runs_to_parquet_bytes
+
+        runs = [
+            _make_run("r1", params={"n": 1}),
+            _make_run("r2", params={"n": 2.5}),
+            _make_run("r3", metrics={"loss": 0.5}, params={"layers": [1, 2]}),
+        ]
+        content = runs_to_parquet_bytes(
+            runs,
+            {b"experiment_id": b"exp:1.0"},
+            captured_data_json=[None, None, '{"a": 1}'],
+            chunk_size=2,
+        )
+
+        parquet = pq.ParquetFile(io.BytesIO(content))
+        table = parquet.read()
+        assert parquet.metadata.num_row_groups == 2
+        assert table.schema.metadata[b"experiment_id"] == b"exp:1.0"
+        assert table.column("param_n").to_pylist() == [1.0, 2.5, None]
+        assert table.column("param_layers").to_pylist() == [None, None, "[1, 2]"]
+        assert table.column("loss").to_pylist() == [None, None, 0.5]
+        assert pa.types.is_dictionary(table.schema.field("status").type)
+        assert table.column("status").to_pylist() == ["success"] * 3
+        assert table.column("captured_data").to_pylist() == [None, None, '{"a": 1}']
+
+    def test_parquet_chunks_stream_row_groups(self):
+        """iter_parquet_chunks yields one piece per row group plus the footer."""
+        pytest.importorskip("pyarrow")
+        import io
+
+        import pyarrow.parquet as pq
+
+        from atlas.export import iter_parquet_chunks
+
+        runs = [_make_run(f"r{i}", metrics={"loss": float(i)}) for i in range(5)]
+        chunks = list(
+            iter_parquet_chunks(runs, {}, include_data=False, chunk_size=2)
+        )
+
+        assert len(chunks) == 4
+        table = pq.read_table(io.BytesIO(b"".join(chunks)))
+        assert table.column("loss").to_pylist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_all_columns_disabled_is_empty(self):
+        """With every include_* flag off, no columns are produced."""
+        pytest.importorskip("pyarrow")
+        from atlas.export import runs_to_arrow_table
+
+        table = runs_to_arrow_table(
+            [_make_run("r1", params={"a": 1})],
+            include_params=False,
+            include_metrics=False,
+            include_derived=False,
+            include_record=False,
+            include_data=False,
+        )
+        assert table.num_columns == 0
+
+
+class TestRecordIsoTimestamps:
+    """Tests for the cached ISO timestamp properties on RecordFields."""
+
+    def test_rendered_once_with_offset(self):
+        """The ISO string keeps the UTC offset and is cached per record."""
+        from datetime import timedelta
+
+        record = _make_run("r1").record.model_copy(
+            update={
+                "started_at": datetime(
+                    2025, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=2))
+                )
+            }
+        )
+
+        assert record.started_at_iso == "2025-01-01T14:00:00+02:00"
+        assert record.started_at_iso is record.started_at_iso
+        assert "started_at_iso" not in record.model_dump()
+
+    def test_running_record_has_no_finished_at(self):
+        """finished_at_iso is None while the run has not finished."""
+        assert _make_run("r1", finished=False).record.finished_at_iso is None
+
+
+class TestCollectCapturedData:
+    """Tests for concurrent captured-data collection."""
+
+    def test_results_keep_run_order(self):
+        """Payloads (or None) stay aligned with run_ids regardless of threading."""
+        from atlas.export import collect_captured_data_json
+
+        store = MagicMock()
+        store.list_results.side_effect = lambda rid: ["b", "a"] if rid != "r2" else []
+        store.get_result.side_effect = lambda rid, name: {"run": rid, "name": name}
+
+        out = collect_captured_data_json(store, ["r1", "r2", "r3"])
+
+        assert len(out) == 3
+        assert out[1] is None
+        assert out[0] == (
+            '{"a":{"name":"a","run":"r1"},"b":{"name":"b","run":"r1"}}'
+        )
+
+
+# =========================================================================
+# PrettyJSONMiddleware
+# =========================================================================
+
+
+def _pretty_client():
+    """TestClient for a tiny app wrapped in PrettyJSONMiddleware."""
+    from fastapi import FastAPI
+    from fastapi.responses import PlainTextResponse
+    from fastapi.testclient import TestClient
+
+    from atlas.main import PrettyJSONMiddleware
+
+    app = FastAPI()
+
+    @app.get("/api/data")
+    async def data():
+        return {"a": [1, 2], "name": "café"}
+
+    @app.get("/api/text")
+    async def text():
+        return PlainTextResponse("plain body")
+
+    @app.get("/status")
+    async def status():
+        return {"ok": True}
+
+    app.add_middleware(PrettyJSONMiddleware)
+    return TestClient(app)
+
+
+class TestPrettyJSONMiddleware:
+    """Tests for ?pretty=true response rewriting."""
+
+    def test_json_is_indented(self):
+        """JSON responses are re-indented with an updated content-length."""
+        response = _pretty_client().get("/api/data?pretty=true")
+
+        assert response.text.startswith('{\n  "a": [')
+        assert "café" in response.text
+        assert int(response.headers["content-length"]) == len(response.content)
+        assert response.json() == {"a": [1, 2], "name": "café"}
+
+    def test_non_json_passes_through(self):
+        """Non-JSON responses are forwarded unchanged."""
+        response = _pretty_client().get("/api/text?pretty=true")
+
+        assert response.text == "plain body"
+        assert response.headers["content-type"].startswith("text/plain")
+
+    def test_without_flag_body_is_compact(self):
+        """Responses are untouched unless pretty=true is requested."""
+        response = _pretty_client().get("/api/data")
+
+        assert "\n" not in response.text
+
+    def test_non_api_paths_are_not_wrapped(self):
+        """Only /api/ routes are eligible for pretty-printing."""
+        response = _pretty_client().get("/status?pretty=true")
+
+        assert response.text == '{"ok":true}'